@@ -1,17 +1,34 @@
 import tkinter as tk  # GUI toolkit for creating the user interface
 import builtins  # Provides access to Python's built-in functions, exceptions, and attributes
 import importlib  # Allows dynamic importing of modules, useful for inspecting installed packages
-import subprocess  # Enables running external commands, like 'pip freeze'
-import inspect  # Provides tools for examining live objects, like getting function signatures and docstrings
-import requests  # Used for making HTTP requests, specifically to fetch data from PyPI
-import json  # For encoding and decoding JSON data, used for caching
+import json  # Decodes PyPI API responses when orjson is not installed; JSONDecodeError for error handling
+import pickle  # Binary serialization, used for all caches
 import os  # Provides functions for interacting with the operating system, like file paths and directories
 import sys  # Provides access to system-specific parameters and functions, like sys.path
 import site  # Provides access to site-specific configuration, like site-packages directories
 import time  # For time-related functions, used in cache expiry calculations
+import tempfile  # Temporary files for atomic cache writes
+import struct  # Packs the length/checksum header written in front of cache files
+import zlib  # CRC32 checksums for detecting damaged cache files, and compression for the PyPI index cache
 from tkinter import font, scrolledtext, messagebox, Menu  # Specific Tkinter widgets and modules
 import re  # Regular expression operations, used for parsing docstrings and highlighting
-import webbrowser  # Allows opening web browsers, used for PyPI links
+import functools  # Provides lru_cache for memoizing lookups
+import types  # MappingProxyType for the read-only curated syntax table
+import collections  # OrderedDict for the LRU cache of highlight results
+import io  # StringIO buffer that display_info writes the documentation text into
+import itertools  # accumulate computes the name offsets of the PyPI search text
+import bisect  # Maps text offsets to line numbers when highlighting, and PyPI matches to package names
+import heapq  # Merges the sorted blocks of the PyPI prefix index
+import array  # Compact offset table for the PyPI search text
+import concurrent.futures  # Thread pool for fetching several PyPI packages in parallel
+import multiprocessing  # Spawned worker process pool that inspects installed packages
+import threading  # Guards lazy creation of the shared HTTP session
+try:
+    import orjson  # Optional Rust-backed JSON library, much faster than json for decoding PyPI responses
+except ImportError:
+    orjson = None  # Fall back to the standard json module
+# Heavier modules are imported inside the functions that use them, so the window opens without paying for them:
+# inspect and importlib.metadata (only needed once something is inspected), requests and webbrowser (only online).
 
 # --- Global Configuration and Directories ---
 # Define directory paths for caching and user notes.
@@ -20,81 +37,1206 @@ CACHE_DIR = os.path.join(os.path.expanduser("~"), ".pyref_cache")
 NOTES_DIR = os.path.join(os.path.expanduser("~"), ".pyref_notes")
 
 # Define specific file paths within the cache directory for different data types.
-STANDARD_CACHE_FILE = os.path.join(CACHE_DIR, "standard_commands.json")
-INSTALLED_CACHE_FILE = os.path.join(CACHE_DIR, "installed_modules.json")
-PYPI_INDEX_CACHE_FILE = os.path.join(CACHE_DIR, "pypi_index.json")
+INSTALLED_CACHE_FILE = os.path.join(CACHE_DIR, "installed_modules.pkl")  # Binary (pickle) cache
+PYPI_INDEX_CACHE_FILE = os.path.join(CACHE_DIR, "pypi_index.pkl")  # Binary (zlib-compressed pickle) cache
 PYPI_DETAIL_CACHE_DIR = os.path.join(CACHE_DIR, "pypi_details")
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[\\/:*?"<>|.]')  # Characters replaced with '_' in cache and notes file names
 
 # --- Cache Expiry Settings ---
 # Define how long different types of cached data remain valid (in seconds).
 # This prevents displaying stale information and ensures periodic updates.
 CACHE_EXPIRY_SECONDS = {
-    "standard": 3600 * 24 * 30,  # Standard commands cache (30 days) - rarely changes
     "installed": 3600 * 24 * 7,   # Installed modules cache (7 days) - updates when pip changes
     "pypi_index": 3600 * 24,      # PyPI index cache (1 day) - frequently updated
     "pypi_detail": 3600 * 24 * 7  # Individual PyPI package details (7 days)
 }
 
+# --- Network Settings ---
+PYPI_FETCH_WORKERS = 8  # Maximum number of concurrent background PyPI detail requests (prefetches)
+PYPI_DETAIL_MEMO_SIZE = 256  # Number of PyPI packages whose details are kept in memory
+PYPI_PREFETCH_LIMIT = 10  # Number of top PyPI rows/search hits whose details are fetched in the background
+PYPI_INDEX_CHUNK_SIZE = 64 * 1024  # Bytes read at a time while streaming the PyPI simple index
+_PYPI_LINK_RE = re.compile(rb'<a [^>]*>([^<]+)</a>')  # One package link in the simple index; captures the project name
+
+# --- Interface and Background Work Settings ---
+PYPI_LIST_LIMIT = 10000  # Maximum number of PyPI packages listed before the user types a filter
+PYPI_FILTER_LIMIT = 500  # Maximum number of PyPI packages listed while live-filtering
+PYPI_SEARCH_LIMIT = 10000  # Maximum number of PyPI packages listed by a full search
+PYPI_PREFIX_SORT_BLOCK = 65536  # Package names sorted at a time while building the PyPI prefix index
+SEARCH_DEBOUNCE_MS = 150  # Typing pause before the live filter runs (milliseconds)
+INSPECT_WORKERS = 8  # Maximum number of worker processes importing and inspecting installed packages
+INSPECT_TIMEOUT_SECONDS = 10  # How long to wait for one package's inspection before giving up on it
+BACKGROUND_POLL_MS = 100  # How often the Tk thread checks on background tasks (milliseconds)
+
+# --- Installed Package Inspection ---
+# Common build/utility packages that aren't typically documented by users (compared lowercased)
+_SKIP_PACKAGES = frozenset({
+    'pip', 'setuptools', 'wheel', 'distlib', 'filelock', 'platformdirs', 'virtualenv', 'colorama', 'tqdm',
+    'certifi', 'charset-normalizer', 'idna', 'requests', 'urllib3',
+})
+# Top-level packages whose members are skipped when listing a module's contents: common standard library or
+# internal modules that are less likely to be individually looked up by users or lead to excessive inspection
+_SKIP_STDLIB_ROOTS = frozenset({
+    'tkinter', 'sys', 'os', 'builtins', 'json', 'requests', 'subprocess', 'inspect', 'site', 'time', 'html',
+    'collections', 'io', 'abc', 'typing', 'enum', 'types', 'weakref', 'functools', 'operator', 'math',
+    'itertools', 're', 'copy', 'decimal', 'datetime', 'hashlib', 'random', 'socket', 'threading', 'queue',
+    'logging', 'warnings', 'xml', 'http', 'ssl', 'urllib', 'uuid', 'zipfile', 'tarfile', 'shutil', 'tempfile',
+    'pathlib', 'glob', 'fnmatch', 'platform', 'getpass', 'mimetypes', 'locale', 'codecs', 'contextlib',
+    'asyncio', 'selectors', 'struct', 'array', 'binascii', 'zlib', 'gzip', 'bz2', 'lzma', 'pickle', 'sqlite3',
+    'csv', 'venv', 'dis', 'pprint', 'traceback', 'code', 'cmd', 'pdb', 'profile', 'pstats', 'test', 'unittest',
+    'doctest', 'lib2to3', 'distutils', 'setuptools', 'packaging', 'pip', 'wheel',
+})
+
+# --- Syntax Highlighting Patterns ---
+# All token patterns are combined into one alternation so the text is scanned once per highlight pass.
+# Strings and comments are matched as whole tokens; URLs inside them are picked out afterwards with _URL_RE.
+# Patterns never cross a line break (whitespace is written as [^\S\n]), matching the old per-line scan.
+_KEYWORDS = frozenset('False None True and as assert async await break class continue def del elif else except finally for from global if import in is lambda nonlocal not or pass raise return try while with yield'.split()) # Python keywords
+_BUILTINS = frozenset('abs all any ascii bin bool breakpoint bytearray bytes callable chr classmethod compile complex delattr dict dir divmod enumerate eval exec filter float format frozenset getattr globals hasattr hash help hex id input int isinstance issubclass iter len list locals map max memoryview min next object oct open ord pow print property range repr reversed round set setattr slice sorted staticmethod str sum super tuple type vars zip __import__'.split()) # Built-in function and type names
+_URL_PATTERN = r'https?://[^\s<>"]+|www\.[^\s<>"]+' # Matches common URL patterns
+_URL_RE = re.compile(_URL_PATTERN)
+_HIGHLIGHT_RE = re.compile(
+    rf'(?P<url>{_URL_PATTERN})'
+    r'|(?P<string>\"\"\".*?\"\"\"|\'\'\'.*?\'\'\'|\".*?\"|\'.*?\')' # Single/double quoted and triple-quoted strings
+    r'|(?P<comment>\#.*$)' # Comments from '#' to end of line
+    r'|(?P<fdef>\bdef[^\S\n]+(?P<fname>[a-zA-Z_]\w*)(?=[^\S\n]*\())' # 'def' plus the function name
+    r'|(?P<cdef>\bclass[^\S\n]+(?P<cname>[a-zA-Z_]\w*)(?=[^\S\n]*[(:]))' # 'class' plus the class name
+    r'|(?P<number>\b\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\b)' # Integers, floats, scientific notation
+    r'|(?P<word>\b[^\W\d]\w*)', # Any identifier; keywords and builtins are picked out with a set lookup
+    re.MULTILINE
+)
+HIGHLIGHT_CACHE_SIZE = 128  # Number of highlighted texts whose tag ranges are kept for reuse
+_HIGHLIGHT_TAGS = ("keyword", "string", "comment", "function", "class", "builtin", "number", "url") # Text tags set by highlighting
+
+# --- Notes Section ---
+_NOTES_SECTION_MARKER = f"\n{'-'*15} Your Notes {'-'*15}\n" # Separates the documentation from the user's notes
+_NOTES_SECTION_MARKER_LINES = _NOTES_SECTION_MARKER.count("\n") # Line breaks the separator adds after the documentation
+_NOTES_MARK = "notes_start" # Text mark at the start of the notes, set while an item's notes are shown
+
+# --- Docstring Example Patterns ---
+# Compiled once at import time; extract_examples_from_docstring runs them on every displayed docstring.
+# Both kinds of example are found in one pass over the docstring, in document order. The alternatives share
+# their start-of-line prefix, so the engine only tries them at the start of the string and after line breaks.
+_EXAMPLE_RE = re.compile(
+    r"(?is)(?:^|\n)(?:"
+    # Alternative 1 ('section'): "Examples:", "Usage:", "How to Use:" followed by content
+    r"(?:(?<=\n)\s*)?(?:Examples?:|Usage(?:s)?:|How to Use:)\s*\n(?P<section>.*?)"
+    # Alternative 2 ('doctest'): lines starting with '>>>' (Python interactive session) and the lines after them
+    r"|(?P<doctest>>>>.*?(?:\n[^\s>>>].*?)*)"
+    # Either ends before another section header or at the end of the string
+    r")(?=\n\s*(?:Parameters|Returns|Yields|Raises|Attributes|Notes|See Also|References|Warnings|Todo|Example|Usage):|\Z)"
+)
+# Fallback: any indented code block (4 spaces or tab) or interactive session
+_CODE_BLOCK_RE = re.compile(r"(?m)^(\s{4}.+|\t.+|>>>.*(?:\n\s{4}.*)*)")
+
+# --- Shared Parameter Descriptions ---
+# Descriptions repeated across several curated built-in entries, defined once and referenced by name.
+_DESC_OBJECT_TO_CHECK = "The object to check."
+_DESC_ATTR_NAME = "A string representing the attribute's name."
+_DESC_ITERATOR_DEFAULT = "Optional. The value to return if the iterator is exhausted."
+_DESC_BYTES_SOURCE = "Optional. An int, iterable of ints, str, or buffer object."
+_DESC_GLOBALS = "Optional. A dictionary of global names."
+_DESC_LOCALS = "Optional. A dictionary of local names."
+_DESC_EXIT_CODE = "Optional. An exit status code (default None)."
+_DESC_CLASSINFO = "A class, type, or tuple of classes and types."
+_DESC_ITERABLES = "One or more iterables."
+_DESC_MINMAX_ITERABLE = "An iterable of values."
+_DESC_MINMAX_ARGS = "Two or more positional arguments."
+_DESC_MINMAX_KEY = "Optional. A function to customize the comparison (like `sorted`)."
+_DESC_MINMAX_DEFAULT = "Optional. The value to return if the iterable is empty (only when one iterable is provided)."
+
+# --- Curated Built-in Syntax ---
+# Explicit syntax, parameters, and simple examples for built-in functions that `inspect.signature()`
+# cannot properly introspect (e.g., because they are implemented in C). Built once at import time and
+# shared read-only: maps built-in names to dicts with 'syntax', 'parameters', and 'example' keys.
+_CURATED_SYNTAX = types.MappingProxyType({
+    "abs": {
+        "syntax": "abs(number)",
+        "parameters": [
+            {"name": "number", "description": "A numeric value (integer, float, or complex)."}
+        ],
+        "example": "x = abs(-7.25)\nprint(x)  # Output: 7.25"
+    },
+    "aiter": {
+        "syntax": "aiter(async_iterable)",
+        "parameters": [
+            {"name": "async_iterable", "description": "An asynchronous iterable object."}
+        ],
+        "example": "async def my_async_gen():\n    yield 1\n    yield 2\n\nasync def main():\n    it = aiter(my_async_gen())\n    print(await anext(it)) # Output: 1\n\nimport asyncio\nasyncio.run(main())"
+    },
+    "all": {
+        "syntax": "all(iterable)",
+        "parameters": [
+            {"name": "iterable", "description": "An iterable (e.g., list, tuple, string) containing items to check."}
+        ],
+        "example": "all([True, True, False])  # Output: False\nall([1, 2, 3])      # Output: True (all are truthy)"
+    },
+    "anext": {
+        "syntax": "anext(async_iterator[, default])",
+        "parameters": [
+            {"name": "async_iterator", "description": "An asynchronous iterator object."},
+            {"name": "default", "description": _DESC_ITERATOR_DEFAULT}
+        ],
+        "example": "async def my_async_gen():\n    yield 1\n    yield 2\n\nasync def main():\n    it = aiter(my_async_gen())\n    print(await anext(it))  # Output: 1\n    print(await anext(it))  # Output: 2\n    print(await anext(it, 'End')) # Output: End\n\nimport asyncio\nasyncio.run(main())"
+    },
+    "any": {
+        "syntax": "any(iterable)",
+        "parameters": [
+            {"name": "iterable", "description": "An iterable containing items to check."}
+        ],
+        "example": "any([False, False, True]) # Output: True\nany([])             # Output: False"
+    },
+    "ascii": {
+        "syntax": "ascii(object)",
+        "parameters": [
+            {"name": "object", "description": "An object to represent as an ASCII string."}
+        ],
+        "example": "ascii('€')  # Output: '\\u20ac'\nascii('hello') # Output: 'hello'"
+    },
+    "bin": {
+        "syntax": "bin(number)",
+        "parameters": [
+            {"name": "number", "description": "An integer."}
+        ],
+        "example": "bin(10)  # Output: '0b1010'"
+    },
+    "bool": {
+        "syntax": "bool([x])",
+        "parameters": [
+            {"name": "x", "description": "An optional value to convert to boolean. If omitted, returns False."}
+        ],
+        "example": "bool(0)     # Output: False\nbool('hello') # Output: True"
+    },
+    "breakpoint": {
+        "syntax": "breakpoint(*args, **kwargs)",
+        "parameters": [
+            {"name": "*args, **kwargs", "description": "Arguments passed to the debugger callable."}
+        ],
+        "example": "def my_func():\n    a = 10\n    breakpoint() # Execution will pause here\n    b = 20\n    print(a + b)\n\n# To use:\n# Run your script, when it hits breakpoint(), you'll enter the debugger (e.g., pdb).\n# Type 'c' to continue execution."
+    },
+    "bytes": {
+        "syntax": "bytes([source[, encoding[, errors]]])",
+        "parameters": [
+            {"name": "source", "description": _DESC_BYTES_SOURCE}
+        ],
+        "example": "bytes(5)          # Output: b'\\x00\\x00\\x00\\x00\\x00'\nb = 'hello'.encode('utf-8')\nprint(b)          # Output: b'hello'"
+    },
+    "bytearray": {
+        "syntax": "bytearray([source[, encoding[, errors]]])",
+        "parameters": [
+            {"name": "source", "description": _DESC_BYTES_SOURCE}
+        ],
+        "example": "arr = bytearray(b'hello')\narr[0] = ord('J')\nprint(arr) # Output: bytearray(b'Jello')"
+    },
+    "callable": {
+        "syntax": "callable(object)",
+        "parameters": [
+            {"name": "object", "description": _DESC_OBJECT_TO_CHECK}
+        ],
+        "example": "def func(): pass\nprint(callable(func))   # Output: True\nprint(callable(10))     # Output: False"
+    },
+    "chr": {
+        "syntax": "chr(i)",
+        "parameters": [
+            {"name": "i", "description": "An integer representing a Unicode code point."}
+        ],
+        "example": "chr(97)  # Output: 'a'"
+    },
+    "compile": {
+        "syntax": "compile(source, filename, mode, flags=0, dont_inherit=False, optimize=-1)",
+        "parameters": [
+            {"name": "source", "description": "The source code as a string, bytes, or AST object."},
+            {"name": "filename", "description": "The filename (used for error messages)."},
+            {"name": "mode", "description": "Specifies the kind of code: 'eval', 'exec', or 'single'."}
+        ],
+        "example": "code_obj = compile('a = 10\\nprint(a)', '<string>', 'exec')\nexec(code_obj) # Output: 10"
+    },
+    "copyright": {
+        "syntax": "copyright",
+        "parameters": [],
+        "example": "print(copyright) # Displays Python's copyright notice"
+    },
+    "credits": {
+        "syntax": "credits",
+        "parameters": [],
+        "example": "print(credits) # Displays Python's credits"
+    },
+    "dict": {
+        "syntax": "dict(**kwargs) or dict(mapping, **kwargs) or dict(iterable, **kwargs)",
+        "parameters": [
+            {"name": "kwargs", "description": "Keyword arguments where keys are strings and values are dictionary values."},
+            {"name": "mapping", "description": "A dictionary or other mapping object."},
+            {"name": "iterable", "description": "An iterable of key-value pairs (e.g., a list of tuples)."}
+        ],
+        "example": "d1 = dict(a=1, b=2)  # Output: {'a': 1, 'b': 2}\nd2 = dict([('c', 3), ('d', 4)]) # Output: {'c': 3, 'd': 4}"
+    },
+    "dir": {
+        "syntax": "dir([object])",
+        "parameters": [
+            {"name": "object", "description": "Optional. An object. If omitted, returns names in the current scope."}
+        ],
+        "example": "dir()          # List names in current scope\ndir([])        # List methods of a list"
+    },
+    "divmod": {
+        "syntax": "divmod(a, b)",
+        "parameters": [
+            {"name": "a", "description": "Dividend."},
+            {"name": "b", "description": "Divisor."}
+        ],
+        "example": "divmod(7, 3)  # Output: (2, 1) (quotient, remainder)"
+    },
+    "enumerate": {
+        "syntax": "enumerate(iterable, start=0)",
+        "parameters": [
+            {"name": "iterable", "description": "A sequence, an iterator, or some other object that supports iteration."},
+            {"name": "start", "description": "Optional. The index value for the first item (default is 0)."}
+        ],
+        "example": "for i, item in enumerate(['a', 'b', 'c']):\n    print(f'{i}: {item}')\n# Output:\n# 0: a\n# 1: b\n# 2: c"
+    },
+    "eval": {
+        "syntax": "eval(expression[, globals[, locals]])",
+        "parameters": [
+            {"name": "expression", "description": "A string containing a Python expression."},
+            {"name": "globals", "description": _DESC_GLOBALS},
+            {"name": "locals", "description": _DESC_LOCALS}
+        ],
+        "example": "x = 10\nprint(eval('x + 5'))  # Output: 15\nprint(eval('sum([1, 2, 3])')) # Output: 6"
+    },
+    "exec": {
+        "syntax": "exec(object[, globals[, locals]])",
+        "parameters": [
+            {"name": "object", "description": "A string containing Python statements, or a code object."},
+            {"name": "globals", "description": _DESC_GLOBALS},
+            {"name": "locals", "description": _DESC_LOCALS}
+        ],
+        "example": "code = 'for i in range(3): print(i)'\nexec(code)\n# Output:\n# 0\n# 1\n# 2"
+    },
+    "exit": {
+        "syntax": "exit([code=None])",
+        "parameters": [
+            {"name": "code", "description": _DESC_EXIT_CODE}
+        ],
+        "example": "import sys\n# exit()\n# exit('Exiting program')\n# Note: Calling exit() directly in some environments (like IDLE) might just raise SystemExit"
+    },
+    "filter": {
+        "syntax": "filter(function, iterable)",
+        "parameters": [
+            {"name": "function", "description": "A function to test if an element of an iterable passes a condition."},
+            {"name": "iterable", "description": "An iterable that is to be filtered."}
+        ],
+        "example": "numbers = [1, 2, 3, 4, 5]\neven_numbers = list(filter(lambda x: x % 2 == 0, numbers))\nprint(even_numbers) # Output: [2, 4]"
+    },
+    "float": {
+        "syntax": "float([x])",
+        "parameters": [
+            {"name": "x", "description": "Optional. A number or string representing a number."}
+        ],
+        "example": "float('3.14') # Output: 3.14\nfloat(5)      # Output: 5.0"
+    },
+    "format": {
+        "syntax": "format(value[, format_spec])",
+        "parameters": [
+            {"name": "value", "description": "The value to be formatted."},
+            {"name": "format_spec", "description": "Optional. A format specifier string (e.g., '.2f', '>10s')."}
+        ],
+        "example": "format(3.14159, '.2f') # Output: '3.14'\nformat(123, '0>5')    # Output: '00123'"
+    },
+    "frozenset": {
+        "syntax": "frozenset([iterable])",
+        "parameters": [
+            {"name": "iterable", "description": "Optional. An iterable from which to initialize the frozenset."}
+        ],
+        "example": "fs = frozenset([1, 2, 3])\nprint(fs) # Output: frozenset({1, 2, 3})"
+    },
+    "getattr": {
+        "syntax": "getattr(object, name[, default])",
+        "parameters": [
+            {"name": "object", "description": "The object to get the attribute from."},
+            {"name": "name", "description": _DESC_ATTR_NAME},
+            {"name": "default", "description": "Optional. The value to return if the named attribute does not exist."}
+        ],
+        "example": "class MyClass:\n    value = 10\nobj = MyClass()\nprint(getattr(obj, 'value'))   # Output: 10\nprint(getattr(obj, 'other', 'default')) # Output: default"
+    },
+    "globals": {
+        "syntax": "globals()",
+        "parameters": [],
+        "example": "print(globals()) # Returns a dictionary of the current global symbol table"
+    },
+    "hasattr": {
+        "syntax": "hasattr(object, name)",
+        "parameters": [
+            {"name": "object", "description": _DESC_OBJECT_TO_CHECK},
+            {"name": "name", "description": _DESC_ATTR_NAME}
+        ],
+        "example": "class MyClass:\n    value = 10\nobj = MyClass()\nprint(hasattr(obj, 'value'))  # Output: True\nprint(hasattr(obj, 'other'))  # Output: False"
+    },
+    "hash": {
+        "syntax": "hash(object)",
+        "parameters": [
+            {"name": "object", "description": "The object to hash."}
+        ],
+        "example": "hash('hello') # Returns an integer hash value"
+    },
+    "help": {
+        "syntax": "help([object])",
+        "parameters": [
+            {"name": "object", "description": "Optional. The object for which to display help."}
+        ],
+        "example": "help(list)   # Displays help for the list type\nhelp('modules') # Lists all available modules"
+    },
+    "hex": {
+        "syntax": "hex(number)",
+        "parameters": [
+            {"name": "number", "description": "An integer."}
+        ],
+        "example": "hex(255)  # Output: '0xff'"
+    },
+    "id": {
+        "syntax": "id(object)",
+        "parameters": [
+            {"name": "object", "description": "Any object."}
+        ],
+        "example": "x = 10\nid(x)  # Returns the identity of x (an integer)"
+    },
+    "input": {
+        "syntax": "input([prompt])",
+        "parameters": [
+            {"name": "prompt", "description": "Optional. A string that is printed to the console before reading input."}
+        ],
+        "example": "name = input('Enter your name: ')\nprint(f'Hello, {name}')"
+    },
+    "int": {
+        "syntax": "int([x=0]) or int(x, base=10)",
+        "parameters": [
+            {"name": "x", "description": "Optional. A number or string to convert to an integer."},
+            {"name": "base", "description": "Optional. The base of the number if `x` is a string (default 10)."}
+        ],
+        "example": "int(3.14)   # Output: 3\nint('FF', 16) # Output: 255"
+    },
+    "isinstance": {
+        "syntax": "isinstance(object, classinfo)",
+        "parameters": [
+            {"name": "object", "description": _DESC_OBJECT_TO_CHECK},
+            {"name": "classinfo", "description": _DESC_CLASSINFO}
+        ],
+        "example": "isinstance(10, int)        # Output: True\nisinstance('hello', (str, list)) # Output: True"
+    },
+    "issubclass": {
+        "syntax": "issubclass(class, classinfo)",
+        "parameters": [
+            {"name": "class", "description": "The class to check."},
+            {"name": "classinfo", "description": _DESC_CLASSINFO}
+        ],
+        "example": "class A: pass\nclass B(A): pass\nissubclass(B, A) # Output: True"
+    },
+    "iter": {
+        "syntax": "iter(object[, sentinel])",
+        "parameters": [
+            {"name": "object", "description": "An object that supports iteration (e.g., list, tuple) or a callable."},
+            {"name": "sentinel", "description": "Optional. If provided, `object` must be a callable; iteration stops when `object()` returns `sentinel`."}
+        ],
+        "example": "my_list = [1, 2, 3]\nmy_iter = iter(my_list)\nprint(next(my_iter)) # Output: 1"
+    },
+    "len": {
+        "syntax": "len(s)",
+        "parameters": [
+            {"name": "s", "description": "An object that has a length (e.g., sequence, collection, string)."}
+        ],
+        "example": "len('hello')  # Output: 5\nlen([1, 2, 3]) # Output: 3"
+    },
+    "license": {
+        "syntax": "license",
+        "parameters": [],
+        "example": "print(license) # Displays Python's license information"
+    },
+    "list": {
+        "syntax": "list([iterable])",
+        "parameters": [
+            {"name": "iterable", "description": "Optional. An iterable from which to create the list."}
+        ],
+        "example": "my_list = list('abc')\nprint(my_list) # Output: ['a', 'b', 'c']"
+    },
+    "locals": {
+        "syntax": "locals()",
+        "parameters": [],
+        "example": "def my_func():\n    x = 10\n    y = 20\n    print(locals()) # Returns a dictionary of the current local symbol table\nmy_func()"
+    },
+    "map": {
+        "syntax": "map(function, iterable, ...)",
+        "parameters": [
+            {"name": "function", "description": "A function to apply to each item of the iterable(s)."},
+            {"name": "iterable", "description": _DESC_ITERABLES}
+        ],
+        "example": "numbers = [1, 2, 3]\nsquared = list(map(lambda x: x*x, numbers))\nprint(squared) # Output: [1, 4, 9]"
+    },
+    "max": {
+        "syntax": "max(iterable, *[, key, default]) or max(arg1, arg2, *args[, key])",
+        "parameters": [
+            {"name": "iterable", "description": _DESC_MINMAX_ITERABLE},
+            {"name": "arg1, arg2, *args", "description": _DESC_MINMAX_ARGS},
+            {"name": "key", "description": _DESC_MINMAX_KEY},
+            {"name": "default", "description": _DESC_MINMAX_DEFAULT}
+        ],
+        "example": "max([1, 5, 2])     # Output: 5\nmax(10, 20, 5)     # Output: 20"
+    },
+    "min": {
+        "syntax": "min(iterable, *[, key, default]) or min(arg1, arg2, *args[, key])",
+        "parameters": [
+            {"name": "iterable", "description": _DESC_MINMAX_ITERABLE},
+            {"name": "arg1, arg2, *args", "description": _DESC_MINMAX_ARGS},
+            {"name": "key", "description": _DESC_MINMAX_KEY},
+            {"name": "default", "description": _DESC_MINMAX_DEFAULT}
+        ],
+        "example": "min([1, 5, 2])     # Output: 1\nmin(10, 20, 5)     # Output: 5"
+    },
+    "next": {
+        "syntax": "next(iterator[, default])",
+        "parameters": [
+            {"name": "iterator", "description": "An iterator object."},
+            {"name": "default", "description": _DESC_ITERATOR_DEFAULT}
+        ],
+        "example": "it = iter([1, 2])\nprint(next(it)) # Output: 1\nprint(next(it)) # Output: 2\nprint(next(it, 'End')) # Output: End"
+    },
+    "object": {
+        "syntax": "object()",
+        "parameters": [],
+        "example": "obj = object()\nprint(type(obj)) # Output: <class 'object'>"
+    },
+    "oct": {
+        "syntax": "oct(number)",
+        "parameters": [
+            {"name": "number", "description": "An integer."}
+        ],
+        "example": "oct(8)  # Output: '0o10'"
+    },
+    "open": {
+        "syntax": "open(file, mode='r', encoding=None, ...)",
+        "parameters": [
+            {"name": "file", "description": "Path to the file or file descriptor."},
+            {"name": "mode", "description": "Optional. Mode string ('r', 'w', 'a', 'b', 't', '+', etc.)."},
+            {"name": "encoding", "description": "Optional. Encoding for text mode (e.g., 'utf-8')."}
+        ],
+        "example": "with open('my_file.txt', 'w') as f:\n    f.write('Hello, world!')"
+    },
+    "ord": {
+        "syntax": "ord(c)",
+        "parameters": [
+            {"name": "c", "description": "A single Unicode character."}
+        ],
+        "example": "ord('A')  # Output: 65"
+    },
+    "pow": {
+        "syntax": "pow(base, exp[, mod])",
+        "parameters": [
+            {"name": "base", "description": "The base number."},
+            {"name": "exp", "description": "The exponent."},
+            {"name": "mod", "description": "Optional. The modulus (if provided, returns (base**exp) % mod)."}
+        ],
+        "example": "pow(2, 3)     # Output: 8\npow(2, 3, 3)  # Output: 2 (8 % 3)"
+    },
+    "print": {
+        "syntax": "print(*objects, sep=' ', end='\\n', file=sys.stdout, flush=False)",
+        "parameters": [
+            {"name": "objects", "description": "One or more objects to print."},
+            {"name": "sep", "description": "Optional. String inserted between values, default a space."},
+            {"name": "end", "description": "Optional. String appended after the last value, default a newline."},
+            {"name": "file", "description": "Optional. A file-like object (stream) to write to, default sys.stdout."},
+            {"name": "flush", "description": "Optional. If True, the stream is forcibly flushed."}
+        ],
+        "example": "print('Hello', 'World', sep='-') # Output: Hello-World\nprint('Done.', end='')"
+    },
+    "property": {
+        "syntax": "property(fget=None, fset=None, fdel=None, doc=None)",
+        "parameters": [
+            {"name": "fget", "description": "Optional. Function to get an attribute value."},
+            {"name": "fset", "description": "Optional. Function to set an attribute value."},
+            {"name": "fdel", "description": "Optional. Function to delete an attribute value."},
+            {"name": "doc", "description": "Optional. Docstring for the property."}
+        ],
+        "example": "class C:\n    def __init__(self, x):\n        self._x = x\n    def getx(self):\n        return self._x\n    def setx(self, value):\n        self._x = value\n    x = property(getx, setx)"
+    },
+    "quit": {
+        "syntax": "quit([code=None])",
+        "parameters": [
+            {"name": "code", "description": _DESC_EXIT_CODE}
+        ],
+        "example": "import sys\n# quit()\n# quit('Exiting program')\n# Note: Calling quit() directly in some environments (like IDLE) might just raise SystemExit"
+    },
+    "range": {
+        "syntax": "range(stop) or range(start, stop[, step])",
+        "parameters": [
+            {"name": "start", "description": "Optional. The starting number of the sequence (inclusive, default 0)."},
+            {"name": "stop", "description": "The ending number of the sequence (exclusive)."},
+            {"name": "step", "description": "Optional. The increment between numbers (default 1)."}
+        ],
+        "example": "list(range(5))        # Output: [0, 1, 2, 3, 4]\nlist(range(1, 10, 2)) # Output: [1, 3, 5, 7, 9]"
+    },
+    "repr": {
+        "syntax": "repr(object)",
+        "parameters": [
+            {"name": "object", "description": "Any object."}
+        ],
+        "example": "repr('hello')  # Output: \"'hello'\"\nrepr([1, 2])   # Output: '[1, 2]'"
+    },
+    "reversed": {
+        "syntax": "reversed(seq)",
+        "parameters": [
+            {"name": "seq", "description": "A sequence object (list, tuple, string) that supports `__len__()` or `__getitem__()`."}
+        ],
+        "example": "list(reversed([1, 2, 3])) # Output: [3, 2, 1]"
+    },
+    "round": {
+        "syntax": "round(number[, ndigits])",
+        "parameters": [
+            {"name": "number", "description": "The number to round."},
+            {"name": "ndigits", "description": "Optional. The number of decimal places to round to. If omitted, rounds to the nearest integer."}
+        ],
+        "example": "round(3.14159, 2) # Output: 3.14\nround(2.5)        # Output: 2 (rounds to nearest even)"
+    },
+    "set": {
+        "syntax": "set([iterable])",
+        "parameters": [
+            {"name": "iterable", "description": "Optional. An iterable from which to initialize the set."}
+        ],
+        "example": "my_set = set([1, 2, 2, 3])\nprint(my_set) # Output: {1, 2, 3}"
+    },
+    "setattr": {
+        "syntax": "setattr(object, name, value)",
+        "parameters": [
+            {"name": "object", "description": "The object to set the attribute on."},
+            {"name": "name", "description": _DESC_ATTR_NAME},
+            {"name": "value", "description": "The value to set the attribute to."}
+        ],
+        "example": "class MyClass:\n    pass\nobj = MyClass()\nsetattr(obj, 'attribute_name', 'some_value')\nprint(obj.attribute_name) # Output: some_value"
+    },
+    "slice": {
+        "syntax": "slice(stop) or slice(start, stop[, step])",
+        "parameters": [
+            {"name": "start", "description": "Optional. The starting index (inclusive, default 0)."},
+            {"name": "stop", "description": "The ending index (exclusive)."},
+            {"name": "step", "description": "Optional. The step or increment (default 1)."}
+        ],
+        "example": "my_list = [1, 2, 3, 4, 5]\ns = slice(1, 4)\nprint(my_list[s]) # Output: [2, 3, 4]"
+    },
+    "sorted": {
+        "syntax": "sorted(iterable, *, key=None, reverse=False)",
+        "parameters": [
+            {"name": "iterable", "description": "An iterable to be sorted."},
+            {"name": "key", "description": "Optional. A function to be called on each list element prior to making comparisons."},
+            {"name": "reverse", "description": "Optional. If True, sort in descending order."}
+        ],
+        "example": "sorted([3, 1, 4]) # Output: [1, 3, 4]\nsorted(['apple', 'Banana'], key=str.lower) # Output: ['Banana', 'apple']"
+    },
+    "staticmethod": {
+        "syntax": "@staticmethod",
+        "parameters": [],
+        "example": "class MyClass:\n    @staticmethod\n    def my_static_method():\n        return 'This is a static method'"
+    },
+    "str": {
+        "syntax": "str(object='') or str(object, encoding, errors)",
+        "parameters": [
+            {"name": "object", "description": "Optional. An object to convert to a string."},
+            {"name": "encoding", "description": "Optional. The encoding of the object if it's bytes."},
+            {"name": "errors", "description": "Optional. How to handle encoding errors."}
+        ],
+        "example": "str(123)       # Output: '123'\nstr(b'bytes', 'utf-8') # Output: 'bytes'"
+    },
+    "sum": {
+        "syntax": "sum(iterable, start=0)",
+        "parameters": [
+            {"name": "iterable", "description": "An iterable of numbers."},
+            {"name": "start", "description": "Optional. An initial value to which the items are added (default 0)."}
+        ],
+        "example": "sum([1, 2, 3])      # Output: 6\nsum([1, 2, 3], 10)  # Output: 16"
+    },
+    "super": {
+        "syntax": "super([type[, object_or_type]])",
+        "parameters": [
+            {"name": "type", "description": "The type of the class that calls `super()`."},
+            {"name": "object_or_type", "description": "An instance of `type` or a subtype of `type`."}
+        ],
+        "example": "class Parent:\n    def greet(self): return 'Hello from Parent'\nclass Child(Parent):\n    def greet(self):\n        return super().greet() + ' and Child'\nprint(Child().greet()) # Output: Hello from Parent and Child"
+    },
+    "tuple": {
+        "syntax": "tuple([iterable])",
+        "parameters": [
+            {"name": "iterable", "description": "Optional. An iterable from which to create the tuple."}
+        ],
+        "example": "my_tuple = tuple([1, 2, 3])\nprint(my_tuple) # Output: (1, 2, 3)"
+    },
+    "type": {
+        "syntax": "type(object) or type(name, bases, dict)",
+        "parameters": [
+            {"name": "object", "description": "The object to get the type of."},
+            {"name": "name", "description": "String representing the class name."},
+            {"name": "bases", "description": "Tuple of base classes."},
+            {"name": "dict", "description": "Dictionary containing the class's namespace."}
+        ],
+        "example": "type(1) # Output: <class 'int'>\nclass MyClass: pass\nMyClassType = type('MyNewClass', (object,), {'x': 1})\nobj = MyClassType()\nprint(obj.x) # Output: 1"
+    },
+    "vars": {
+        "syntax": "vars([object])",
+        "parameters": [
+            {"name": "object", "description": "Optional. An object. If omitted, returns the `__dict__` of the current module."}
+        ],
+        "example": "class MyClass:\n    def __init__(self):\n        self.x = 1\n        self.y = 2\nobj = MyClass()\nprint(vars(obj)) # Output: {'x': 1, 'y': 2}"
+    },
+    "zip": {
+        "syntax": "zip(*iterables)",
+        "parameters": [
+            {"name": "iterables", "description": _DESC_ITERABLES}
+        ],
+        "example": "list(zip([1, 2], ['a', 'b'])) # Output: [(1, 'a'), (2, 'b')]"
+    }
+})
+# The builtins module's own namespace dict (a live view, not a copy): name -> object with a plain dict lookup
+_BUILTIN_NAMESPACE = vars(builtins)
+
 # --- Cache Management Functions ---
 
+_dirs_ready = False  # Set once the cache/notes directories are known to exist
+_CACHE_HEADER = struct.Struct('<II')  # Payload length and CRC32, prepended to every cache file
+
 def ensure_cache_dir():
     """Ensures that the necessary cache and notes directories exist.
     
     If they don't exist, they are created. This prevents FileNotFoundError.
+    The directories are only created on the first call; later calls return immediately.
     """
+    global _dirs_ready
+    if _dirs_ready:
+        return
     os.makedirs(CACHE_DIR, exist_ok=True)  # Creates the main cache directory if it doesn't exist
     os.makedirs(NOTES_DIR, exist_ok=True)  # Creates the notes directory if it doesn't exist
     os.makedirs(PYPI_DETAIL_CACHE_DIR, exist_ok=True) # Creates the specific directory for PyPI package details
+    _dirs_ready = True
+
+def _write_file_atomically(cache_file: str, payload: bytes):
+    """Writes bytes to a file so readers only ever see the old or the complete new content.
+
+    The payload is written to a temporary file in the same directory and then moved over
+    the target with os.replace, which is atomic on the same filesystem on all platforms.
+    An interrupted write therefore never leaves a truncated cache behind.
+
+    Args:
+        cache_file (str): The full path to the file to write.
+        payload (bytes): The complete file content.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_file), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_file)
+    except BaseException:
+        os.remove(tmp_path)  # Don't leave partial temporary files in the cache directory
+        raise
+
+def _write_cache_file(cache_file: str, payload: bytes):
+    """Writes a cache payload prefixed with its length and CRC32 checksum.
+
+    Args:
+        cache_file (str): The full path to the cache file.
+        payload (bytes): The serialized cache data.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    _write_file_atomically(cache_file, _CACHE_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+
+def _read_cache_file(cache_file: str):
+    """Reads a cache payload written by _write_cache_file and verifies its checksum.
+
+    A damaged, truncated or old-format file is detected from the header alone, before any
+    attempt to decode it. Such a file is deleted so the cache gets rebuilt.
+
+    Args:
+        cache_file (str): The full path to the cache file.
+
+    Returns:
+        bytes or None: The payload if it is intact, otherwise None.
 
-def load_cache(cache_file: str, cache_type: str):
-    """Loads data from a specified cache file if it's not expired.
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(cache_file, 'rb') as f:
+        data = f.read()
+    if len(data) >= _CACHE_HEADER.size:
+        length, checksum = _CACHE_HEADER.unpack_from(data)
+        payload = data[_CACHE_HEADER.size:]
+        if length == len(payload) and checksum == zlib.crc32(payload):
+            return payload
+    print(f"Cache file {cache_file} is damaged. Cache will be refreshed.")
+    os.remove(cache_file)  # Delete the corrupted cache to force a refresh
+    return None
+
+def load_cache(cache_file: str, cache_type: str, ignore_expiry: bool = False, compressed: bool = False):
+    """Loads data from a pickle cache file if it's not expired.
+
+    All caches are pickled: decoding a pickle is much faster than parsing the
+    equivalent JSON, which matters most for the large PyPI index.
 
     Args:
         cache_file (str): The full path to the cache file.
-        cache_type (str): The type of cache (e.g., "standard", "installed")
+        cache_type (str): The type of cache (e.g., "pypi_index", "installed")
                           to determine its expiry time from CACHE_EXPIRY_SECONDS.
+        ignore_expiry (bool, optional): If True, return the data even if it is expired.
+                                        Defaults to False.
+        compressed (bool, optional): If True, the file was saved with `save_cache(..., compressed=True)`.
+                                     Defaults to False.
 
     Returns:
         dict or list or None: The loaded data if valid and not expired, otherwise None.
     """
     ensure_cache_dir()  # Make sure directories are ready before trying to load/save
-    if os.path.exists(cache_file):
-        file_mod_time = os.path.getmtime(cache_file)  # Get the last modification time of the cache file
-        # Check if the cache file is still valid (not expired)
-        if (time.time() - file_mod_time) < CACHE_EXPIRY_SECONDS.get(cache_type, 0):
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)  # Load and return the JSON data
-            except json.JSONDecodeError:
-                # Handle corrupted JSON files
-                print(f"Error decoding JSON from {cache_file}. Cache will be refreshed.")
-                os.remove(cache_file)  # Delete the corrupted cache to force a refresh
-                return None
-            except Exception as e:
-                # Catch any other unexpected errors during file loading
-                print(f"Unexpected error loading cache from {cache_file}: {e}")
+    try:
+        file_mod_time = os.stat(cache_file).st_mtime  # One stat call both checks existence and gets the mtime
+    except FileNotFoundError:
+        return None  # No cache file yet
+    # Check if the cache file is still valid (not expired)
+    if ignore_expiry or (time.time() - file_mod_time) < CACHE_EXPIRY_SECONDS.get(cache_type, 0):
+        try:
+            payload = _read_cache_file(cache_file)
+            if payload is None:
                 return None
-    return None  # Return None if cache file doesn't exist or is expired
+            if compressed:
+                payload = zlib.decompress(payload)
+            return pickle.loads(payload)  # Load and return the unpickled data
+        except (pickle.UnpicklingError, EOFError, zlib.error):
+            # Handle corrupted or truncated pickle files (or ones written before compression was used)
+            print(f"Error unpickling {cache_file}. Cache will be refreshed.")
+            os.remove(cache_file)  # Delete the corrupted cache to force a refresh
+            return None
+        except Exception as e:
+            # Catch any other unexpected errors during file loading
+            print(f"Unexpected error loading cache from {cache_file}: {e}")
+            return None
+    return None  # Return None if the cache file is expired
 
-def save_cache(data, cache_file: str):
-    """Saves data to a specified cache file in JSON format.
+def save_cache(data, cache_file: str, compressed: bool = False):
+    """Saves data to a specified cache file in pickle format (protocol 5).
 
     Args:
         data: The data (e.g., list, dictionary) to be saved.
         cache_file (str): The full path to the cache file.
+        compressed (bool, optional): If True, zlib-compress the pickle at the fastest level, which suits
+                                     large, repetitive data such as the PyPI index. Defaults to False.
     """
     ensure_cache_dir()  # Ensure directories exist before saving
     try:
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)  # Save data as pretty-printed JSON
-    except IOError as e:
+        payload = pickle.dumps(data, protocol=5)
+        if compressed:
+            payload = zlib.compress(payload, 1)
+        _write_cache_file(cache_file, payload)
+    except (IOError, pickle.PicklingError) as e:
         # Handle potential errors during file writing
         print(f"Error saving cache to {cache_file}: {e}")
 
+def pypi_detail_cache_file(package_name: str):
+    """Returns the path of the detail cache file for a PyPI package.
+
+    Args:
+        package_name (str): The name of the PyPI package.
+
+    Returns:
+        str: The full path to the package's cache file.
+    """
+    # Create a safe filename for caching, replacing problematic characters
+    safe_package_name = _UNSAFE_FILENAME_CHARS_RE.sub('_', package_name)
+    return os.path.join(PYPI_DETAIL_CACHE_DIR, f"{safe_package_name}.pkl")
+
+_pypi_detail_memo = {}  # Package name -> details read from or written to the detail cache this session
+_pypi_detail_memo_lock = threading.Lock()  # Guards inserting and evicting, which worker threads do too
+
+def remember_pypi_details(package_name: str, data: dict):
+    """Keeps a PyPI package's details in memory, evicting the oldest entry when the memo is full.
+
+    Args:
+        package_name (str): The name of the PyPI package.
+        data (dict): The package details, as stored in its detail cache file.
+    """
+    with _pypi_detail_memo_lock:
+        _pypi_detail_memo.pop(package_name, None) # Re-inserting moves it to the newest end
+        if len(_pypi_detail_memo) >= PYPI_DETAIL_MEMO_SIZE:
+            del _pypi_detail_memo[next(iter(_pypi_detail_memo))] # Dicts keep insertion order: this is the oldest
+        _pypi_detail_memo[package_name] = data
+
+def forget_pypi_details(package_name: str):
+    """Drops a PyPI package's details from memory, so the next lookup reads its cache file again."""
+    with _pypi_detail_memo_lock:
+        _pypi_detail_memo.pop(package_name, None)
+
+def load_pypi_detail_cache(package_name: str):
+    """Loads a PyPI package's cached details, memoized in memory for the session.
+
+    Repeat views of the same package are served from memory without touching the disk.
+    Misses are not memoized, so a detail file written later (e.g. by a prefetch) is found.
+
+    Args:
+        package_name (str): The name of the PyPI package.
+
+    Returns:
+        dict or None: The cached details if present and not expired, otherwise None.
+    """
+    data = _pypi_detail_memo.get(package_name)
+    if data is not None:
+        return data
+    entry = load_cache(pypi_detail_cache_file(package_name), "pypi_detail")
+    # Detail files hold {"etag": ..., "data": ...}; files without the envelope count as missing
+    data = entry.get("data") if entry else None
+    if data is not None:
+        remember_pypi_details(package_name, data)
+    return data
+
+def decode_json(payload: bytes):
+    """Decodes a JSON document from raw response bytes, with orjson when it is installed.
+
+    Args:
+        payload (bytes): The JSON document, e.g. `response.content`.
+
+    Returns:
+        The decoded Python object.
+
+    Raises:
+        json.JSONDecodeError: If the payload is not valid JSON (orjson's error is a subclass).
+    """
+    if orjson is not None:
+        return orjson.loads(payload)  # Decodes straight from bytes, without an intermediate str
+    return json.loads(payload)
+
+# --- Reflection Helpers ---
+
+def format_syntax(display_name: str, obj):
+    """Renders the "Syntax" section (signature and parameters) for an object.
+
+    Args:
+        display_name (str): The name to show in the signature.
+        obj: The object to describe.
+
+    Returns:
+        str: The section text, ending with a blank line.
+    """
+    import inspect
+    lines = []
+    try:
+        if (inspect.isclass(obj) and obj.__module__ == 'builtins'
+                and getattr(obj, '__text_signature__', None) is None):
+            # C types without a text signature (most exceptions, for instance) always make
+            # inspect.signature raise, so skip the doomed call and its exception unwinding.
+            lines.append("  (Signature not available for this object)\n\n")
+        # Try to get the signature for functions, classes, and methods
+        elif inspect.isfunction(obj) or inspect.isclass(obj) or inspect.ismethod(obj):
+            signature = inspect.signature(obj) # Get the function/method signature
+            lines.append(f"  {display_name}{signature}\n\n")
+
+            # Display parameters if available in the signature
+            if signature.parameters:
+                lines.append("Parameters:\n")
+                for name, param in signature.parameters.items():
+                    param_info = f"  - {name}"
+                    if param.annotation != inspect.Parameter.empty:
+                        # Add type hints, stripping "typing." prefix for brevity
+                        param_info += f": {str(param.annotation).replace('typing.', '')}"
+                    if param.default != inspect.Parameter.empty:
+                        param_info += f" = {repr(param.default)}" # Add default value
+                    lines.append(param_info + "\n")
+                lines.append("\n")
+            else:
+                lines.append("  (No parameters)\n\n")
+        else:
+            lines.append("  (Syntax not directly applicable or easily determined programmatically)\n\n")
+    except ValueError:
+        # This typically happens for C-implemented objects where signature is not exposed
+        lines.append("  (Signature not available for this object)\n\n")
+    return "".join(lines)
+
+@functools.lru_cache(maxsize=4096)
+def reflect_member(module_name: str, attr_name: str):
+    """Imports a module and describes one of its attributes, memoized per (module, attribute).
+
+    Call `reflect_member.cache_clear()` when installed packages change.
+
+    Args:
+        module_name (str): The name of the module.
+        attr_name (str): The name of the attribute within the module.
+
+    Returns:
+        tuple: (type name, "Syntax" section text from format_syntax, docstring).
+
+    Raises:
+        ImportError: If the module cannot be imported.
+        AttributeError: If the module has no such attribute.
+    """
+    import inspect
+    # Already-imported modules come straight from sys.modules, skipping the import machinery's locks and finders
+    module = sys.modules.get(module_name) or importlib.import_module(module_name) # Import the parent module
+    obj = getattr(module, attr_name) # Get the specific member object
+    docstring = inspect.getdoc(obj) or "No documentation available." # Get object's docstring
+    return type(obj).__name__, format_syntax(attr_name, obj), docstring
+
+def inspect_module(module_name: str):
+    """Inspects a Python module to extract its functions, classes, submodules, and docstring.
+
+    Runs in a worker process (see _collect_installed_modules), so it is a module-level function
+    and returns only plain, picklable data.
+
+    Args:
+        module_name (str): The name of the module to inspect.
+
+    Returns:
+        dict: A dictionary containing 'functions', 'classes', 'modules' lists, and 'doc'.
+    """
+    import inspect
+    info = {"functions": [], "classes": [], "modules": [], "doc": "No module documentation available."}
+    try:
+        module = importlib.import_module(module_name) # Dynamically import the module
+        info["doc"] = inspect.getdoc(module) or "No module documentation available." # Get module-level docstring
+
+        # Iterate through members of the module's own namespace. Unlike inspect.getmembers, this doesn't getattr
+        # every name from dir(), so members only reachable through a lazy module __getattr__ (PEP 562) aren't
+        # force-imported. Sorted by name, the order getmembers produced.
+        for name, obj in sorted(vars(module).items()):
+            if name.startswith('_'): # Skip private/special members
+                continue
+            # Skip members re-exported from common standard library or internal modules (see _SKIP_STDLIB_ROOTS);
+            # partition stops at the first dot and, unlike split, builds no list
+            module_of = getattr(obj, '__module__', None)
+            if module_of and module_of.partition('.')[0] in _SKIP_STDLIB_ROOTS:
+                continue
+
+            # Categorize members
+            if inspect.isfunction(obj):
+                info["functions"].append(name)
+            elif inspect.isclass(obj):
+                info["classes"].append(name)
+            elif inspect.ismodule(obj):
+                info["modules"].append(name)
+    except ImportError:
+        # Handle modules that cannot be imported (e.g., C extensions, non-importable packages)
+        print(f"Could not import {module_name}. It might not be directly importable or is a namespace package.")
+        info["doc"] = f"Could not import module '{module_name}'. It might be a namespace package or requires specific import syntax."
+    except Exception as e:
+        # Catch any other inspection errors
+        print(f"Error inspecting {module_name}: {e}")
+        info["doc"] = f"Error inspecting module '{module_name}': {e}"
+    return info
+
+# --- Search Helpers ---
+
+# Search results are shown as "<prefix><name>". Keyed by the prefix's first word, so an item
+# needs one split and one dict lookup to find its category: (category, full prefix).
+_ITEM_PREFIXES = {
+    "STANDARD:": ("STANDARD", "STANDARD: "),
+    "INSTALLED:": ("INSTALLED", "INSTALLED: "),
+    "NOT": ("PYPI", "NOT INSTALLED (PyPi): "),
+}
+
+def split_item_prefix(item: str):
+    """Splits a search-result prefix such as "INSTALLED: " off a listbox item.
+
+    Args:
+        item (str): The listbox item text.
+
+    Returns:
+        tuple: (category, name); category is None if the item carries no prefix.
+    """
+    entry = _ITEM_PREFIXES.get(item.split(" ", 1)[0])
+    if entry and item.startswith(entry[1]):
+        return entry[0], item[len(entry[1]):]
+    return None, item
+
+def build_pypi_text(packages):
+    """Joins the lowercased PyPI package names into one string for substring search.
+
+    One str.find over the joined text runs in C, where testing each name with `in` runs a
+    Python-level loop; a single string also takes a fraction of the memory of half a million
+    separate lowercase copies.
+
+    Args:
+        packages (list of str): The package names.
+
+    Returns:
+        tuple: The lowercase names, each followed by a newline, as one string, and an array of
+        the offsets at which each name starts (plus the length of the string at the end).
+    """
+    packages_lower = [package.lower() for package in packages] # Lowercasing can change the length of non-ASCII names
+    starts = array.array('Q', itertools.accumulate((len(package) + 1 for package in packages_lower), initial=0))
+    return "".join(f"{package}\n" for package in packages_lower), starts
+
+def _pypi_text_name(pypi_text, position: int):
+    """Returns the lowercase name at a position of a build_pypi_text result, without its newline."""
+    text, starts = pypi_text
+    return text[starts[position]:starts[position + 1] - 1]
+
+def build_prefix_index(pypi_text):
+    """Orders PyPI package positions by lowercase name so prefix matches can be found by bisection.
+
+    Only the positions are kept; bisecting reads the names back out of `pypi_text`, so the index
+    adds 8 bytes per package rather than another list of strings. Sorting one block at a time and
+    merging the blocks keeps just one block's names in memory while it runs.
+
+    Args:
+        pypi_text (tuple): The result of build_pypi_text for the package names.
+
+    Returns:
+        array.array: Positions into the package list, sorted by their lowercase names.
+    """
+    name_at = functools.partial(_pypi_text_name, pypi_text)
+    count = len(pypi_text[1]) - 1
+    runs = [array.array('Q', sorted(range(first, min(first + PYPI_PREFIX_SORT_BLOCK, count)), key=name_at))
+            for first in range(0, count, PYPI_PREFIX_SORT_BLOCK)]
+    return array.array('Q', heapq.merge(*runs, key=name_at)) # merge holds one name per block at a time
+
+def match_pypi_packages(packages, pypi_text, query: str, limit: int = None, prefix_index=None):
+    """Finds PyPI package names that contain every space-separated term of a search query, ignoring case.
+
+    Safe to call from worker threads: it only reads the data passed in.
+
+    Args:
+        packages (list of str): The package names, in display order.
+        pypi_text (tuple): The result of build_pypi_text for these names, built once per index.
+        query (str): The lowercased search text.
+        limit (int, optional): Stop after this many matches. Defaults to None (no limit).
+        prefix_index (array.array, optional): The result of build_prefix_index for these names. When a
+            single-term query has at least `limit` names starting with it, those are returned
+            without scanning the whole index. Defaults to None (always scan).
+
+    Returns:
+        list of str: The matching package names, in index order (alphabetical, ignoring case,
+        when the prefix shortcut applied).
+    """
+    terms = query.split()
+    if len(terms) == 1 and limit is not None and prefix_index is not None:
+        name_at = functools.partial(_pypi_text_name, pypi_text)
+        start = bisect.bisect_left(prefix_index, terms[0], key=name_at)
+        end = bisect.bisect_left(prefix_index, terms[0] + "\uffff", start, key=name_at) # Just past the last prefix match
+        if end - start >= limit:
+            # Enough prefix matches; skip the substring scan
+            return [packages[position] for position in prefix_index[start:start + limit]]
+    if not terms:
+        return packages[:limit]
+    text, starts = pypi_text
+    term = max(terms, key=len) # Find the longest term, usually the rarest; check any others per name
+    matches = []
+    position = text.find(term)
+    while position != -1:
+        index = bisect.bisect_right(starts, position) - 1 # The name containing this hit; terms never span a newline
+        end = starts[index + 1]
+        if len(terms) == 1 or all(other in text[starts[index]:end] for other in terms):
+            matches.append(packages[index])
+            if len(matches) == limit:
+                break
+        position = text.find(term, end) # Resume at the next name, so each name is reported once
+    return matches
+
+def search_entries(standard_commands, installed_modules):
+    """Yields (lowercased searchable text, listbox item) pairs for the standard and installed names.
+
+    Args:
+        standard_commands (list of str): The built-in names.
+        installed_modules (dict): The installed modules cache (module name -> info dict).
+    """
+    for cmd in standard_commands:
+        yield cmd.lower(), f"STANDARD: {cmd}"
+    for module_name, info in installed_modules.items():
+        yield module_name.lower(), f"INSTALLED: {module_name}"
+        for name_list in (info.get("functions", []), info.get("classes", []), info.get("modules", [])):
+            for member_name in name_list:
+                # The qualified name contains the member name, so matching it covers both
+                qualified_name = f"{module_name}.{member_name}"
+                yield qualified_name.lower(), f"INSTALLED: {qualified_name}"
+
+def build_search_index(entries):
+    """Indexes searchable names by the two-character substrings (bigrams) they contain.
+
+    Any name containing a query of two or more characters contains every bigram of the query,
+    so a search only has to check the names listed under one of them (see search_index).
+
+    Args:
+        entries (iterable of tuple): (lowercased searchable text, listbox item) pairs.
+
+    Returns:
+        tuple: (list of the searchable texts, list of the listbox items at the same positions,
+        dict mapping each bigram to the positions of the entries containing it).
+    """
+    texts, items = [], []
+    postings = collections.defaultdict(list)
+    for position, (text, item) in enumerate(entries):
+        texts.append(text) # Parallel lists: the match loop only touches texts, never (text, item) tuples
+        items.append(item)
+        for bigram in {text[i:i + 2] for i in range(len(text) - 1)}:
+            postings[bigram].append(position)
+    return texts, items, dict(postings)
+
+def search_index(index, query: str):
+    """Finds the items whose searchable text contains every space-separated term of a query.
+
+    Args:
+        index (tuple): The index returned by build_search_index.
+        query (str): The lowercased search text.
+
+    Returns:
+        list of str: The matching listbox items, in index order.
+    """
+    texts, items, postings = index
+    terms = query.split()
+    bigrams = [term[i:i + 2] for term in terms for i in range(len(term) - 1)]
+    if not bigrams:
+        candidates = range(len(texts)) # Only one-character terms, so no bigram to narrow by; check every entry
+    else:
+        # Only entries listed under the query's rarest bigram can match; confirm each with substring tests
+        candidates = min((postings.get(bigram, ()) for bigram in bigrams), key=len)
+    if len(terms) == 1:
+        term = terms[0]
+        return [items[position] for position in candidates if term in texts[position]]
+    return [items[position] for position in candidates
+            if all(term in texts[position] for term in terms)]
+
 # --- PyRef GUI Class ---
 class PythonHelperGUI:
     """The main application class for PyRef, handling the GUI and logic."""
 
+    # Text of the Help > About dialog; CACHE_DIR is fixed at import, so it is formatted once here
+    _ABOUT_TEXT = f"""
+        **PyRef: Your Offline Python Reference & Personal Notebook**
+
+        **What is PyRef?**
+        PyRef is a lightweight, local desktop application designed to be your quick, offline reference for Python. It provides instant access to documentation for:
+        
+        1.  **Standard Python Commands:** Built-in functions, types, and constants (e.g., `print()`, `list`, `True`).
+        2.  **Installed Python Modules:** Documentation for packages you've installed via `pip` (e.g., `requests`, `numpy`, `pygame`) and their individual functions, classes, and submodules.
+        3.  **PyPI Packages (Not Installed):** Information on packages available on the Python Package Index (PyPI), allowing you to discover new tools and see installation commands without leaving the app.
+
+        **Key Features:**
+        * **Offline Access:** Once cached, documentation for standard and installed modules is available without an internet connection. PyPI package details are cached for future offline viewing too.
+        * **Personal Notes:** Add and save your own notes, reminders, and code snippets directly alongside the documentation for any item. Your notes are saved locally and persist between sessions.
+        * **Integrated Search:** Quickly find documentation across all categories (Standard, Installed, PyPI). Separate several terms with spaces to find names containing all of them.
+        * **Syntax Highlighting:** Docstrings and code examples are enhanced with basic Python syntax highlighting for better readability.
+        * **Clickable URLs:** External links (like PyPI project pages or homepages) are clickable, opening directly in your web browser.
+        * **History Navigation:** Use the "Back" and "Forward" buttons to easily revisit previously viewed items.
+        * **Configurable Font Size:** Adjust the text size to your preference for comfortable reading.
+        * **Dynamic UI:** Resizable panels allow you to customize the layout.
+        
+        **Why PyRef?**
+        PyRef aims to provide a fast, focused, and personal documentation experience, reducing the need to constantly switch to web browsers or external documentation sites when you just need a quick lookup or want to jot down a thought related to a specific function.
+
+        **Caching & Data:**
+        PyRef intelligently caches data to minimize network requests and maximize offline utility.
+        * Standard commands are read straight from the running interpreter.
+        * Installed modules are re-indexed weekly to reflect changes from `pip install`/`uninstall`.
+        * PyPI index is refreshed daily. Individual PyPI package details are cached for 7 days.
+        All cache files and your personal notes are stored in:
+        `{CACHE_DIR}` (your home directory's hidden PyRef cache folder).
+
+        **Author:** Andrew Stephens (goldalchemist)
+        **Version:** 1.0
+        **License:** MIT License
+
+        Thank you for using PyRef!
+        """
+
     def __init__(self, master: tk.Tk):
         """Initializes the PyRef GUI application.
 
@@ -107,553 +1249,6 @@ class PythonHelperGUI:
 
         self._setup_sys_path()  # Configure system path for module imports
 
-        # --- Curated Syntax Overrides for C-implemented Built-ins ---
-        # This dictionary provides explicit syntax, parameters, and simple examples for
-        # built-in functions that `inspect.signature()` cannot properly introspect
-        # (e.g., because they are implemented in C). This ensures clear documentation
-        # for these common functions.
-        self._builtin_syntax_override = {
-            "abs": {
-                "syntax": "abs(number)",
-                "parameters": [
-                    {"name": "number", "description": "A numeric value (integer, float, or complex)."}
-                ],
-                "example": "x = abs(-7.25)\nprint(x)  # Output: 7.25"
-            },
-            "aiter": {
-                "syntax": "aiter(async_iterable)",
-                "parameters": [
-                    {"name": "async_iterable", "description": "An asynchronous iterable object."}
-                ],
-                "example": "async def my_async_gen():\n    yield 1\n    yield 2\n\nasync def main():\n    it = aiter(my_async_gen())\n    print(await anext(it)) # Output: 1\n\nimport asyncio\nasyncio.run(main())"
-            },
-            "all": {
-                "syntax": "all(iterable)",
-                "parameters": [
-                    {"name": "iterable", "description": "An iterable (e.g., list, tuple, string) containing items to check."}
-                ],
-                "example": "all([True, True, False])  # Output: False\nall([1, 2, 3])      # Output: True (all are truthy)"
-            },
-            "anext": {
-                "syntax": "anext(async_iterator[, default])",
-                "parameters": [
-                    {"name": "async_iterator", "description": "An asynchronous iterator object."},
-                    {"name": "default", "description": "Optional. The value to return if the iterator is exhausted."}
-                ],
-                "example": "async def my_async_gen():\n    yield 1\n    yield 2\n\nasync def main():\n    it = aiter(my_async_gen())\n    print(await anext(it))  # Output: 1\n    print(await anext(it))  # Output: 2\n    print(await anext(it, 'End')) # Output: End\n\nimport asyncio\nasyncio.run(main())"
-            },
-            "any": {
-                "syntax": "any(iterable)",
-                "parameters": [
-                    {"name": "iterable", "description": "An iterable containing items to check."}
-                ],
-                "example": "any([False, False, True]) # Output: True\nany([])             # Output: False"
-            },
-            "ascii": {
-                "syntax": "ascii(object)",
-                "parameters": [
-                    {"name": "object", "description": "An object to represent as an ASCII string."}
-                ],
-                "example": "ascii('€')  # Output: '\\u20ac'\nascii('hello') # Output: 'hello'"
-            },
-            "bin": {
-                "syntax": "bin(number)",
-                "parameters": [
-                    {"name": "number", "description": "An integer."}
-                ],
-                "example": "bin(10)  # Output: '0b1010'"
-            },
-            "bool": {
-                "syntax": "bool([x])",
-                "parameters": [
-                    {"name": "x", "description": "An optional value to convert to boolean. If omitted, returns False."}
-                ],
-                "example": "bool(0)     # Output: False\nbool('hello') # Output: True"
-            },
-            "breakpoint": {
-                "syntax": "breakpoint(*args, **kwargs)",
-                "parameters": [
-                    {"name": "*args, **kwargs", "description": "Arguments passed to the debugger callable."}
-                ],
-                "example": "def my_func():\n    a = 10\n    breakpoint() # Execution will pause here\n    b = 20\n    print(a + b)\n\n# To use:\n# Run your script, when it hits breakpoint(), you'll enter the debugger (e.g., pdb).\n# Type 'c' to continue execution."
-            },
-            "bytes": {
-                "syntax": "bytes([source[, encoding[, errors]]])",
-                "parameters": [
-                    {"name": "source", "description": "Optional. An int, iterable of ints, str, or buffer object."}
-                ],
-                "example": "bytes(5)          # Output: b'\\x00\\x00\\x00\\x00\\x00'\nb = 'hello'.encode('utf-8')\nprint(b)          # Output: b'hello'"
-            },
-            "bytearray": {
-                "syntax": "bytearray([source[, encoding[, errors]]])",
-                "parameters": [
-                    {"name": "source", "description": "Optional. An int, iterable of ints, str, or buffer object."}
-                ],
-                "example": "arr = bytearray(b'hello')\narr[0] = ord('J')\nprint(arr) # Output: bytearray(b'Jello')"
-            },
-            "callable": {
-                "syntax": "callable(object)",
-                "parameters": [
-                    {"name": "object", "description": "The object to check."}
-                ],
-                "example": "def func(): pass\nprint(callable(func))   # Output: True\nprint(callable(10))     # Output: False"
-            },
-            "chr": {
-                "syntax": "chr(i)",
-                "parameters": [
-                    {"name": "i", "description": "An integer representing a Unicode code point."}
-                ],
-                "example": "chr(97)  # Output: 'a'"
-            },
-            "compile": {
-                "syntax": "compile(source, filename, mode, flags=0, dont_inherit=False, optimize=-1)",
-                "parameters": [
-                    {"name": "source", "description": "The source code as a string, bytes, or AST object."},
-                    {"name": "filename", "description": "The filename (used for error messages)."},
-                    {"name": "mode", "description": "Specifies the kind of code: 'eval', 'exec', or 'single'."}
-                ],
-                "example": "code_obj = compile('a = 10\\nprint(a)', '<string>', 'exec')\nexec(code_obj) # Output: 10"
-            },
-            "copyright": {
-                "syntax": "copyright",
-                "parameters": [],
-                "example": "print(copyright) # Displays Python's copyright notice"
-            },
-            "credits": {
-                "syntax": "credits",
-                "parameters": [],
-                "example": "print(credits) # Displays Python's credits"
-            },
-            "dict": {
-                "syntax": "dict(**kwargs) or dict(mapping, **kwargs) or dict(iterable, **kwargs)",
-                "parameters": [
-                    {"name": "kwargs", "description": "Keyword arguments where keys are strings and values are dictionary values."},
-                    {"name": "mapping", "description": "A dictionary or other mapping object."},
-                    {"name": "iterable", "description": "An iterable of key-value pairs (e.g., a list of tuples)."}
-                ],
-                "example": "d1 = dict(a=1, b=2)  # Output: {'a': 1, 'b': 2}\nd2 = dict([('c', 3), ('d', 4)]) # Output: {'c': 3, 'd': 4}"
-            },
-            "dir": {
-                "syntax": "dir([object])",
-                "parameters": [
-                    {"name": "object", "description": "Optional. An object. If omitted, returns names in the current scope."}
-                ],
-                "example": "dir()          # List names in current scope\ndir([])        # List methods of a list"
-            },
-            "divmod": {
-                "syntax": "divmod(a, b)",
-                "parameters": [
-                    {"name": "a", "description": "Dividend."},
-                    {"name": "b", "description": "Divisor."}
-                ],
-                "example": "divmod(7, 3)  # Output: (2, 1) (quotient, remainder)"
-            },
-            "enumerate": {
-                "syntax": "enumerate(iterable, start=0)",
-                "parameters": [
-                    {"name": "iterable", "description": "A sequence, an iterator, or some other object that supports iteration."},
-                    {"name": "start", "description": "Optional. The index value for the first item (default is 0)."}
-                ],
-                "example": "for i, item in enumerate(['a', 'b', 'c']):\n    print(f'{i}: {item}')\n# Output:\n# 0: a\n# 1: b\n# 2: c"
-            },
-            "eval": {
-                "syntax": "eval(expression[, globals[, locals]])",
-                "parameters": [
-                    {"name": "expression", "description": "A string containing a Python expression."},
-                    {"name": "globals", "description": "Optional. A dictionary of global names."},
-                    {"name": "locals", "description": "Optional. A dictionary of local names."}
-                ],
-                "example": "x = 10\nprint(eval('x + 5'))  # Output: 15\nprint(eval('sum([1, 2, 3])')) # Output: 6"
-            },
-            "exec": {
-                "syntax": "exec(object[, globals[, locals]])",
-                "parameters": [
-                    {"name": "object", "description": "A string containing Python statements, or a code object."},
-                    {"name": "globals", "description": "Optional. A dictionary of global names."},
-                    {"name": "locals", "description": "Optional. A dictionary of local names."}
-                ],
-                "example": "code = 'for i in range(3): print(i)'\nexec(code)\n# Output:\n# 0\n# 1\n# 2"
-            },
-            "exit": {
-                "syntax": "exit([code=None])",
-                "parameters": [
-                    {"name": "code", "description": "Optional. An exit status code (default None)."}
-                ],
-                "example": "import sys\n# exit()\n# exit('Exiting program')\n# Note: Calling exit() directly in some environments (like IDLE) might just raise SystemExit"
-            },
-            "filter": {
-                "syntax": "filter(function, iterable)",
-                "parameters": [
-                    {"name": "function", "description": "A function to test if an element of an iterable passes a condition."},
-                    {"name": "iterable", "description": "An iterable that is to be filtered."}
-                ],
-                "example": "numbers = [1, 2, 3, 4, 5]\neven_numbers = list(filter(lambda x: x % 2 == 0, numbers))\nprint(even_numbers) # Output: [2, 4]"
-            },
-            "float": {
-                "syntax": "float([x])",
-                "parameters": [
-                    {"name": "x", "description": "Optional. A number or string representing a number."}
-                ],
-                "example": "float('3.14') # Output: 3.14\nfloat(5)      # Output: 5.0"
-            },
-            "format": {
-                "syntax": "format(value[, format_spec])",
-                "parameters": [
-                    {"name": "value", "description": "The value to be formatted."},
-                    {"name": "format_spec", "description": "Optional. A format specifier string (e.g., '.2f', '>10s')."}
-                ],
-                "example": "format(3.14159, '.2f') # Output: '3.14'\nformat(123, '0>5')    # Output: '00123'"
-            },
-            "frozenset": {
-                "syntax": "frozenset([iterable])",
-                "parameters": [
-                    {"name": "iterable", "description": "Optional. An iterable from which to initialize the frozenset."}
-                ],
-                "example": "fs = frozenset([1, 2, 3])\nprint(fs) # Output: frozenset({1, 2, 3})"
-            },
-            "getattr": {
-                "syntax": "getattr(object, name[, default])",
-                "parameters": [
-                    {"name": "object", "description": "The object to get the attribute from."},
-                    {"name": "name", "description": "A string representing the attribute's name."},
-                    {"name": "default", "description": "Optional. The value to return if the named attribute does not exist."}
-                ],
-                "example": "class MyClass:\n    value = 10\nobj = MyClass()\nprint(getattr(obj, 'value'))   # Output: 10\nprint(getattr(obj, 'other', 'default')) # Output: default"
-            },
-            "globals": {
-                "syntax": "globals()",
-                "parameters": [],
-                "example": "print(globals()) # Returns a dictionary of the current global symbol table"
-            },
-            "hasattr": {
-                "syntax": "hasattr(object, name)",
-                "parameters": [
-                    {"name": "object", "description": "The object to check."},
-                    {"name": "name", "description": "A string representing the attribute's name."}
-                ],
-                "example": "class MyClass:\n    value = 10\nobj = MyClass()\nprint(hasattr(obj, 'value'))  # Output: True\nprint(hasattr(obj, 'other'))  # Output: False"
-            },
-            "hash": {
-                "syntax": "hash(object)",
-                "parameters": [
-                    {"name": "object", "description": "The object to hash."}
-                ],
-                "example": "hash('hello') # Returns an integer hash value"
-            },
-            "help": {
-                "syntax": "help([object])",
-                "parameters": [
-                    {"name": "object", "description": "Optional. The object for which to display help."}
-                ],
-                "example": "help(list)   # Displays help for the list type\nhelp('modules') # Lists all available modules"
-            },
-            "hex": {
-                "syntax": "hex(number)",
-                "parameters": [
-                    {"name": "number", "description": "An integer."}
-                ],
-                "example": "hex(255)  # Output: '0xff'"
-            },
-            "id": {
-                "syntax": "id(object)",
-                "parameters": [
-                    {"name": "object", "description": "Any object."}
-                ],
-                "example": "x = 10\nid(x)  # Returns the identity of x (an integer)"
-            },
-            "input": {
-                "syntax": "input([prompt])",
-                "parameters": [
-                    {"name": "prompt", "description": "Optional. A string that is printed to the console before reading input."}
-                ],
-                "example": "name = input('Enter your name: ')\nprint(f'Hello, {name}')"
-            },
-            "int": {
-                "syntax": "int([x=0]) or int(x, base=10)",
-                "parameters": [
-                    {"name": "x", "description": "Optional. A number or string to convert to an integer."},
-                    {"name": "base", "description": "Optional. The base of the number if `x` is a string (default 10)."}
-                ],
-                "example": "int(3.14)   # Output: 3\nint('FF', 16) # Output: 255"
-            },
-            "isinstance": {
-                "syntax": "isinstance(object, classinfo)",
-                "parameters": [
-                    {"name": "object", "description": "The object to check."},
-                    {"name": "classinfo", "description": "A class, type, or tuple of classes and types."}
-                ],
-                "example": "isinstance(10, int)        # Output: True\nisinstance('hello', (str, list)) # Output: True"
-            },
-            "issubclass": {
-                "syntax": "issubclass(class, classinfo)",
-                "parameters": [
-                    {"name": "class", "description": "The class to check."},
-                    {"name": "classinfo", "description": "A class, type, or tuple of classes and types."}
-                ],
-                "example": "class A: pass\nclass B(A): pass\nissubclass(B, A) # Output: True"
-            },
-            "iter": {
-                "syntax": "iter(object[, sentinel])",
-                "parameters": [
-                    {"name": "object", "description": "An object that supports iteration (e.g., list, tuple) or a callable."},
-                    {"name": "sentinel", "description": "Optional. If provided, `object` must be a callable; iteration stops when `object()` returns `sentinel`."}
-                ],
-                "example": "my_list = [1, 2, 3]\nmy_iter = iter(my_list)\nprint(next(my_iter)) # Output: 1"
-            },
-            "len": {
-                "syntax": "len(s)",
-                "parameters": [
-                    {"name": "s", "description": "An object that has a length (e.g., sequence, collection, string)."}
-                ],
-                "example": "len('hello')  # Output: 5\nlen([1, 2, 3]) # Output: 3"
-            },
-            "license": {
-                "syntax": "license",
-                "parameters": [],
-                "example": "print(license) # Displays Python's license information"
-            },
-            "list": {
-                "syntax": "list([iterable])",
-                "parameters": [
-                    {"name": "iterable", "description": "Optional. An iterable from which to create the list."}
-                ],
-                "example": "my_list = list('abc')\nprint(my_list) # Output: ['a', 'b', 'c']"
-            },
-            "locals": {
-                "syntax": "locals()",
-                "parameters": [],
-                "example": "def my_func():\n    x = 10\n    y = 20\n    print(locals()) # Returns a dictionary of the current local symbol table\nmy_func()"
-            },
-            "map": {
-                "syntax": "map(function, iterable, ...)",
-                "parameters": [
-                    {"name": "function", "description": "A function to apply to each item of the iterable(s)."},
-                    {"name": "iterable", "description": "One or more iterables."}
-                ],
-                "example": "numbers = [1, 2, 3]\nsquared = list(map(lambda x: x*x, numbers))\nprint(squared) # Output: [1, 4, 9]"
-            },
-            "max": {
-                "syntax": "max(iterable, *[, key, default]) or max(arg1, arg2, *args[, key])",
-                "parameters": [
-                    {"name": "iterable", "description": "An iterable of values."},
-                    {"name": "arg1, arg2, *args", "description": "Two or more positional arguments."},
-                    {"name": "key", "description": "Optional. A function to customize the comparison (like `sorted`)."},
-                    {"name": "default", "description": "Optional. The value to return if the iterable is empty (only when one iterable is provided)."}
-                ],
-                "example": "max([1, 5, 2])     # Output: 5\nmax(10, 20, 5)     # Output: 20"
-            },
-            "min": {
-                "syntax": "min(iterable, *[, key, default]) or min(arg1, arg2, *args[, key])",
-                "parameters": [
-                    {"name": "iterable", "description": "An iterable of values."},
-                    {"name": "arg1, arg2, *args", "description": "Two or more positional arguments."},
-                    {"name": "key", "description": "Optional. A function to customize the comparison (like `sorted`)."},
-                    {"name": "default", "description": "Optional. The value to return if the iterable is empty (only when one iterable is provided)."}
-                ],
-                "example": "min([1, 5, 2])     # Output: 1\nmin(10, 20, 5)     # Output: 5"
-            },
-            "next": {
-                "syntax": "next(iterator[, default])",
-                "parameters": [
-                    {"name": "iterator", "description": "An iterator object."},
-                    {"name": "default", "description": "Optional. The value to return if the iterator is exhausted."}
-                ],
-                "example": "it = iter([1, 2])\nprint(next(it)) # Output: 1\nprint(next(it)) # Output: 2\nprint(next(it, 'End')) # Output: End"
-            },
-            "object": {
-                "syntax": "object()",
-                "parameters": [],
-                "example": "obj = object()\nprint(type(obj)) # Output: <class 'object'>"
-            },
-            "oct": {
-                "syntax": "oct(number)",
-                "parameters": [
-                    {"name": "number", "description": "An integer."}
-                ],
-                "example": "oct(8)  # Output: '0o10'"
-            },
-            "open": {
-                "syntax": "open(file, mode='r', encoding=None, ...)",
-                "parameters": [
-                    {"name": "file", "description": "Path to the file or file descriptor."},
-                    {"name": "mode", "description": "Optional. Mode string ('r', 'w', 'a', 'b', 't', '+', etc.)."},
-                    {"name": "encoding", "description": "Optional. Encoding for text mode (e.g., 'utf-8')."}
-                ],
-                "example": "with open('my_file.txt', 'w') as f:\n    f.write('Hello, world!')"
-            },
-            "ord": {
-                "syntax": "ord(c)",
-                "parameters": [
-                    {"name": "c", "description": "A single Unicode character."}
-                ],
-                "example": "ord('A')  # Output: 65"
-            },
-            "pow": {
-                "syntax": "pow(base, exp[, mod])",
-                "parameters": [
-                    {"name": "base", "description": "The base number."},
-                    {"name": "exp", "description": "The exponent."},
-                    {"name": "mod", "description": "Optional. The modulus (if provided, returns (base**exp) % mod)."}
-                ],
-                "example": "pow(2, 3)     # Output: 8\npow(2, 3, 3)  # Output: 2 (8 % 3)"
-            },
-            "print": {
-                "syntax": "print(*objects, sep=' ', end='\\n', file=sys.stdout, flush=False)",
-                "parameters": [
-                    {"name": "objects", "description": "One or more objects to print."},
-                    {"name": "sep", "description": "Optional. String inserted between values, default a space."},
-                    {"name": "end", "description": "Optional. String appended after the last value, default a newline."},
-                    {"name": "file", "description": "Optional. A file-like object (stream) to write to, default sys.stdout."},
-                    {"name": "flush", "description": "Optional. If True, the stream is forcibly flushed."}
-                ],
-                "example": "print('Hello', 'World', sep='-') # Output: Hello-World\nprint('Done.', end='')"
-            },
-            "property": {
-                "syntax": "property(fget=None, fset=None, fdel=None, doc=None)",
-                "parameters": [
-                    {"name": "fget", "description": "Optional. Function to get an attribute value."},
-                    {"name": "fset", "description": "Optional. Function to set an attribute value."},
-                    {"name": "fdel", "description": "Optional. Function to delete an attribute value."},
-                    {"name": "doc", "description": "Optional. Docstring for the property."}
-                ],
-                "example": "class C:\n    def __init__(self, x):\n        self._x = x\n    def getx(self):\n        return self._x\n    def setx(self, value):\n        self._x = value\n    x = property(getx, setx)"
-            },
-            "quit": {
-                "syntax": "quit([code=None])",
-                "parameters": [
-                    {"name": "code", "description": "Optional. An exit status code (default None)."}
-                ],
-                "example": "import sys\n# quit()\n# quit('Exiting program')\n# Note: Calling quit() directly in some environments (like IDLE) might just raise SystemExit"
-            },
-            "range": {
-                "syntax": "range(stop) or range(start, stop[, step])",
-                "parameters": [
-                    {"name": "start", "description": "Optional. The starting number of the sequence (inclusive, default 0)."},
-                    {"name": "stop", "description": "The ending number of the sequence (exclusive)."},
-                    {"name": "step", "description": "Optional. The increment between numbers (default 1)."}
-                ],
-                "example": "list(range(5))        # Output: [0, 1, 2, 3, 4]\nlist(range(1, 10, 2)) # Output: [1, 3, 5, 7, 9]"
-            },
-            "repr": {
-                "syntax": "repr(object)",
-                "parameters": [
-                    {"name": "object", "description": "Any object."}
-                ],
-                "example": "repr('hello')  # Output: \"'hello'\"\nrepr([1, 2])   # Output: '[1, 2]'"
-            },
-            "reversed": {
-                "syntax": "reversed(seq)",
-                "parameters": [
-                    {"name": "seq", "description": "A sequence object (list, tuple, string) that supports `__len__()` or `__getitem__()`."}
-                ],
-                "example": "list(reversed([1, 2, 3])) # Output: [3, 2, 1]"
-            },
-            "round": {
-                "syntax": "round(number[, ndigits])",
-                "parameters": [
-                    {"name": "number", "description": "The number to round."},
-                    {"name": "ndigits", "description": "Optional. The number of decimal places to round to. If omitted, rounds to the nearest integer."}
-                ],
-                "example": "round(3.14159, 2) # Output: 3.14\nround(2.5)        # Output: 2 (rounds to nearest even)"
-            },
-            "set": {
-                "syntax": "set([iterable])",
-                "parameters": [
-                    {"name": "iterable", "description": "Optional. An iterable from which to initialize the set."}
-                ],
-                "example": "my_set = set([1, 2, 2, 3])\nprint(my_set) # Output: {1, 2, 3}"
-            },
-            "setattr": {
-                "syntax": "setattr(object, name, value)",
-                "parameters": [
-                    {"name": "object", "description": "The object to set the attribute on."},
-                    {"name": "name", "description": "A string representing the attribute's name."},
-                    {"name": "value", "description": "The value to set the attribute to."}
-                ],
-                "example": "class MyClass:\n    pass\nobj = MyClass()\nsetattr(obj, 'attribute_name', 'some_value')\nprint(obj.attribute_name) # Output: some_value"
-            },
-            "slice": {
-                "syntax": "slice(stop) or slice(start, stop[, step])",
-                "parameters": [
-                    {"name": "start", "description": "Optional. The starting index (inclusive, default 0)."},
-                    {"name": "stop", "description": "The ending index (exclusive)."},
-                    {"name": "step", "description": "Optional. The step or increment (default 1)."}
-                ],
-                "example": "my_list = [1, 2, 3, 4, 5]\ns = slice(1, 4)\nprint(my_list[s]) # Output: [2, 3, 4]"
-            },
-            "sorted": {
-                "syntax": "sorted(iterable, *, key=None, reverse=False)",
-                "parameters": [
-                    {"name": "iterable", "description": "An iterable to be sorted."},
-                    {"name": "key", "description": "Optional. A function to be called on each list element prior to making comparisons."},
-                    {"name": "reverse", "description": "Optional. If True, sort in descending order."}
-                ],
-                "example": "sorted([3, 1, 4]) # Output: [1, 3, 4]\nsorted(['apple', 'Banana'], key=str.lower) # Output: ['Banana', 'apple']"
-            },
-            "staticmethod": {
-                "syntax": "@staticmethod",
-                "parameters": [],
-                "example": "class MyClass:\n    @staticmethod\n    def my_static_method():\n        return 'This is a static method'"
-            },
-            "str": {
-                "syntax": "str(object='') or str(object, encoding, errors)",
-                "parameters": [
-                    {"name": "object", "description": "Optional. An object to convert to a string."},
-                    {"name": "encoding", "description": "Optional. The encoding of the object if it's bytes."},
-                    {"name": "errors", "description": "Optional. How to handle encoding errors."}
-                ],
-                "example": "str(123)       # Output: '123'\nstr(b'bytes', 'utf-8') # Output: 'bytes'"
-            },
-            "sum": {
-                "syntax": "sum(iterable, start=0)",
-                "parameters": [
-                    {"name": "iterable", "description": "An iterable of numbers."},
-                    {"name": "start", "description": "Optional. An initial value to which the items are added (default 0)."}
-                ],
-                "example": "sum([1, 2, 3])      # Output: 6\nsum([1, 2, 3], 10)  # Output: 16"
-            },
-            "super": {
-                "syntax": "super([type[, object_or_type]])",
-                "parameters": [
-                    {"name": "type", "description": "The type of the class that calls `super()`."},
-                    {"name": "object_or_type", "description": "An instance of `type` or a subtype of `type`."}
-                ],
-                "example": "class Parent:\n    def greet(self): return 'Hello from Parent'\nclass Child(Parent):\n    def greet(self):\n        return super().greet() + ' and Child'\nprint(Child().greet()) # Output: Hello from Parent and Child"
-            },
-            "tuple": {
-                "syntax": "tuple([iterable])",
-                "parameters": [
-                    {"name": "iterable", "description": "Optional. An iterable from which to create the tuple."}
-                ],
-                "example": "my_tuple = tuple([1, 2, 3])\nprint(my_tuple) # Output: (1, 2, 3)"
-            },
-            "type": {
-                "syntax": "type(object) or type(name, bases, dict)",
-                "parameters": [
-                    {"name": "object", "description": "The object to get the type of."},
-                    {"name": "name", "description": "String representing the class name."},
-                    {"name": "bases", "description": "Tuple of base classes."},
-                    {"name": "dict", "description": "Dictionary containing the class's namespace."}
-                ],
-                "example": "type(1) # Output: <class 'int'>\nclass MyClass: pass\nMyClassType = type('MyNewClass', (object,), {'x': 1})\nobj = MyClassType()\nprint(obj.x) # Output: 1"
-            },
-            "vars": {
-                "syntax": "vars([object])",
-                "parameters": [
-                    {"name": "object", "description": "Optional. An object. If omitted, returns the `__dict__` of the current module."}
-                ],
-                "example": "class MyClass:\n    def __init__(self):\n        self.x = 1\n        self.y = 2\nobj = MyClass()\nprint(vars(obj)) # Output: {'x': 1, 'y': 2}"
-            },
-            "zip": {
-                "syntax": "zip(*iterables)",
-                "parameters": [
-                    {"name": "iterables", "description": "One or more iterables."}
-                ],
-                "example": "list(zip([1, 2], ['a', 'b'])) # Output: [(1, 'a'), (2, 'b')]"
-            }
-        }
-        # End of curated syntax overrides
-
         # --- Menu Bar Setup ---
         self.menubar = Menu(master)  # Create a menu bar
         master.config(menu=self.menubar)  # Assign the menu bar to the root window
@@ -668,6 +1263,10 @@ class PythonHelperGUI:
 
         self.search_entry = tk.Entry(top_controls_frame)  # Input field for search queries
         self.search_entry.pack(side=tk.LEFT, padx=5, expand=True, fill=tk.X)  # Pack to the left, expands horizontally
+        self.search_entry.bind("<KeyRelease>", self._schedule_pypi_filter)  # Live-filter the PyPI list while typing
+        self._pypi_filter_after_id = None  # Pending debounced PyPI filter, if any
+        self._listbox_items = []  # Entries currently shown in the menu listbox (see _set_listbox_items)
+        self._listbox_index = None  # Entry -> position in the listbox, built lazily
         self.search_button = tk.Button(top_controls_frame, text="Search", command=self.search)  # Search button
         self.search_button.pack(side=tk.LEFT, padx=5)
 
@@ -713,7 +1312,10 @@ class PythonHelperGUI:
         listbox_frame = tk.Frame(left_frame)  # Frame to hold the listbox and its scrollbar
         listbox_frame.pack(fill=tk.BOTH, expand=True)
 
-        self.menu_listbox = tk.Listbox(listbox_frame, width=30, font=self.menu_listbox_font)  # Listbox to display commands/modules
+        # The listbox shows the contents of a Tcl list variable, so a whole listing is swapped in with one assignment
+        self._listbox_var = tk.StringVar(master)
+        self.menu_listbox = tk.Listbox(listbox_frame, width=30, font=self.menu_listbox_font,
+                                       listvariable=self._listbox_var)  # Listbox to display commands/modules
         self.menu_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         # Bind the listbox selection event to our handler
         self.menu_listbox.bind('<<ListboxSelect>>', self._handle_listbox_select)
@@ -743,9 +1345,34 @@ class PythonHelperGUI:
         # --- Application State Variables ---
         self.current_selected_item = None  # Stores the name of the currently displayed item
         self.current_category = "STANDARD"  # Stores the currently active category (STANDARD, INSTALLED, PYPI, SEARCH)
+        # Category -> method that lists it; anything else (SEARCH, EMPTY_SEARCH) falls back to show_standard
+        self._category_views = {"STANDARD": self.show_standard, "INSTALLED": self.show_installed, "PYPI": self.show_pypi}
 
         self.history = []  # List to store navigation history (tuples of (category, item_name_with_prefix))
         self.history_index = -1  # Current position in the history list
+        self._highlight_cache = collections.OrderedDict()  # (start line, text) -> tag ranges, in LRU order
+        self._notes_cache = {}  # Notes file path -> notes text, for files already read or written this session
+        self._notes_present = None  # Names of the existing notes files, listed once at startup
+
+        # --- Networking ---
+        # A single session reuses pooled keep-alive connections to PyPI instead of a new TCP/TLS handshake per request.
+        # It is created on first use (see http_session) so requests is only imported once PyRef goes online.
+        self._http_session = None
+        self._http_session_lock = threading.Lock()
+        # Worker threads for fetching PyPI package details in the background
+        self._pypi_fetch_executor = concurrent.futures.ThreadPoolExecutor(max_workers=PYPI_FETCH_WORKERS)
+        # Packages queued or downloading -> the prefetch_pypi_details call that last asked for them, so repeated
+        # prefetches don't fetch twice and queued ones for rows no longer listed can be skipped
+        self._pypi_prefetching = {}
+        self._prefetch_generation = 0  # Counts prefetch_pypi_details calls; the latest one is the listing shown
+        self._pypi_prefetching_lock = threading.Lock()  # Keeps "already queued?" and a worker's removal apart
+        # Worker threads for the startup refreshes (installed modules, PyPI index); see _run_in_background
+        self._background_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        # A worker of its own for searches and the live filter, so they never queue behind those long refreshes
+        self._search_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._background_status = None  # Latest status text posted by a worker thread, shown by the Tk thread
+        self._closing = threading.Event()  # Set by _on_close; long-running workers check it and stop early
+        self.master.protocol("WM_DELETE_WINDOW", self._on_close) # Release network resources when the window closes
 
         # --- Status Bar ---
         # Displays messages to the user about current operations or status.
@@ -755,47 +1382,66 @@ class PythonHelperGUI:
         self._configure_tags()  # Setup text tags for syntax highlighting and clickable URLs
 
         # --- Initial Data Loading and Caching ---
+        # Empty until _deferred_init fills them from the event loop.
+        self.standard_commands = []
+        self.installed_modules_cache = {}
+        self.pypi_index_cache = []
+        self._pypi_text = build_pypi_text([])  # Lowercased names for searching
+        self._pypi_prefix_index = None  # Names sorted for prefix lookups; see _rebuild_pypi_prefix_index
+        self._search_index = None  # Bigram index over standard and installed names; see _rebuild_search_index
+        self._search_serial = 0  # Counts searches, so only the latest one's results are shown
+        self._shown_search = None  # (query, installed modules, PyPI index, listbox items) of the last search shown
         self.status_bar.config(text="Initializing caches...")
-        self.master.update_idletasks()  # Force GUI update to show status message
+        self.master.after(0, self._deferred_init)  # Runs once the event loop starts, instead of blocking window creation
 
-        # Load standard commands cache or build it if not available/expired.
-        self.standard_commands_cache = load_cache(STANDARD_CACHE_FILE, "standard")
-        if self.standard_commands_cache is None:
-            self.status_bar.config(text="Building standard commands cache (first run, this is fast)...")
-            self.master.update_idletasks()
-            self.standard_commands_cache = sorted(dir(builtins))  # Get all built-in names
-            save_cache(self.standard_commands_cache, STANDARD_CACHE_FILE)
-            self.status_bar.config(text="Standard commands cache built.")
-        self.standard_commands = self.standard_commands_cache  # Assign to active variable
+    def _deferred_init(self):
+        """Loads the caches and fills the listbox once the window is on screen.
+
+        Scheduled by __init__ so the window appears immediately instead of after the cache loads.
+        """
+        ensure_cache_dir() # Create the cache and notes directories once, before anything reads or writes them
+
+        # Standard commands are fixed by the running interpreter, so they are listed directly
+        # rather than cached: reading a cache file would cost more than dir(builtins) itself.
+        self.standard_commands = sorted(_BUILTIN_NAMESPACE)  # Get all built-in names (the same names dir() lists)
+
+        # Most items have no notes; one directory listing lets load_user_notes skip opening their files
+        try:
+            self._notes_present = {filename for filename in os.listdir(NOTES_DIR)
+                                   if filename.startswith("notes_for_") and filename.endswith(".txt")}
+        except OSError:
+            self._notes_present = set() # No notes directory yet, so no notes
 
         # Load installed modules cache and PyPI index cache.
         self.installed_modules_cache = load_cache(INSTALLED_CACHE_FILE, "installed") or {}
         # Corrected variable name from PYPI_INDEX_FILE to PYPI_INDEX_CACHE_FILE
-        self.pypi_index_cache = load_cache(PYPI_INDEX_CACHE_FILE, "pypi_index") or []
+        self.pypi_index_cache = load_cache(PYPI_INDEX_CACHE_FILE, "pypi_index", compressed=True) or []
+        self._pypi_text = build_pypi_text(self.pypi_index_cache)  # Case-folded once for searching
 
+        self.show_standard()  # Display standard commands by default on startup
+        self.status_bar.config(text="PyRef is ready!")  # Final status message
+
+        # The slow refreshes run in the background so the window is usable while they work.
+        self._rebuild_search_index() # Index the loaded names for search
+        self._rebuild_pypi_prefix_index()
         # Update installed modules (checks for changes since last run)
         self.update_installed_modules()
         # Fetch PyPI packages if the cache is empty (first run or expired)
         if not self.pypi_index_cache:
             self.fetch_pypi_packages()
 
-        self.show_standard()  # Display standard commands by default on startup
-        self.status_bar.config(text="PyRef is ready!")  # Final status message
-
     def _setup_sys_path(self):
         """Adds standard Python site-packages directories to sys.path.
         
         This ensures that dynamically imported modules (e.g., in INSTALLED category)
         can be found by the interpreter.
         """
-        # Add global site-packages directories
-        for sp_dir in site.getsitepackages():
-            if sp_dir not in sys.path:
+        existing_paths = set(sys.path) # Set membership instead of scanning sys.path for every directory
+        # Add global site-packages directories, then the user-specific site-packages directory
+        for sp_dir in [*site.getsitepackages(), site.getusersitepackages()]:
+            if sp_dir not in existing_paths:
                 sys.path.append(sp_dir)
-        # Add user-specific site-packages directory
-        user_site_packages = site.getusersitepackages()
-        if user_site_packages not in sys.path:
-            sys.path.append(user_site_packages)
+                existing_paths.add(sp_dir)
 
     def _configure_tags(self):
         """Configures text tags for syntax highlighting and clickable URLs in the info_text widget.
@@ -822,77 +1468,82 @@ class PythonHelperGUI:
             content_end_line (str): The ending text index (e.g., "end-1c").
         """
         # Remove all existing tags from the specified range to clear previous highlighting
-        for tag in ["keyword", "string", "comment", "function", "class", "builtin", "number", "url"]:
+        for tag in _HIGHLIGHT_TAGS:
             text_widget.tag_remove(tag, content_start_line, content_end_line)
 
-        # Define regular expressions for different syntax elements
-        keywords = r'\b(False|None|True|and|as|assert|async|await|break|class|continue|def|del|elif|else|except|finally|for|from|global|if|import|in|is|lambda|nonlocal|not|or|pass|raise|return|try|while|with|yield)\b'
-        builtins_re = r'\b(abs|all|any|ascii|bin|bool|breakpoint|bytearray|bytes|callable|chr|classmethod|compile|complex|delattr|dict|dir|divmod|enumerate|eval|exec|filter|float|format|frozenset|getattr|globals|hasattr|hash|help|hex|id|input|int|isinstance|issubclass|iter|len|list|locals|map|max|memoryview|min|next|object|oct|open|ord|pow|print|property|range|repr|reversed|round|set|setattr|slice|sorted|staticmethod|str|sum|super|tuple|type|vars|zip|__import__)\b'
-        strings = r'(\"\"\"[\s\S]*?\"\"\"|\'\'\'[\s\S]*?\'\'\'|\".*?\"|\'.*?\')' # Handles single/double quoted and triple-quoted strings
-        comments = r'\#.*$' # Matches comments from '#' to end of line
-        numbers = r'\b\d+(\.\d+)?([eE][+-]?\d+)?\b' # Matches integers, floats, scientific notation
-        functions_def = r'\bdef\s+([a-zA-Z_]\w*)\s*\(' # Captures function names after 'def'
-        classes_def = r'\bclass\s+([a-zA-Z_]\w*)\s*(\(|\:)' # Captures class names after 'class'
-        urls_re = r'https?://[^\s<>"]+|www\.[^\s<>"]+' # Matches common URL patterns
-
         # Get the text content from the specified range for processing
         text_content = text_widget.get(content_start_line, content_end_line)
-        lines = text_content.splitlines() # Split content into individual lines
-        
+
         # Determine the starting line number in the widget for correct index calculation
         start_line_num = int(float(content_start_line))
-        
-        # Iterate through each line and apply highlighting based on regex matches
-        for i, line in enumerate(lines):
-            current_line_index = f"{start_line_num + i}.0" # Current line's starting index in the widget
-            
-            # Apply tags for each regex pattern
-            for match in re.finditer(keywords, line):
-                start = f"{current_line_index}+{match.start()}c"
-                end = f"{current_line_index}+{match.end()}c"
-                text_widget.tag_add("keyword", start, end)
-
-            for match in re.finditer(builtins_re, line):
-                start = f"{current_line_index}+{match.start()}c"
-                end = f"{current_line_index}+{match.end()}c"
-                text_widget.tag_add("builtin", start, end)
-
-            for match in re.finditer(strings, line):
-                start = f"{current_line_index}+{match.start()}c"
-                end = f"{current_line_index}+{match.end()}c"
-                text_widget.tag_add("string", start, end)
-
-            for match in re.finditer(comments, line):
-                start = f"{current_line_index}+{match.start()}c"
-                end = f"{current_line_index}+{match.end()}c"
-                text_widget.tag_add("comment", start, end)
-            
-            for match in re.finditer(numbers, line):
-                start = f"{current_line_index}+{match.start()}c"
-                end = f"{current_line_index}+{match.end()}c"
-                text_widget.tag_add("number", start, end)
-
-            # Highlighting for function definitions (only the name)
-            for match in re.finditer(functions_def, line):
-                name_start = match.start(1)
-                name_end = match.end(1)
-                start = f"{current_line_index}+{name_start}c"
-                end = f"{current_line_index}+{name_end}c"
-                text_widget.tag_add("function", start, end)
-
-            # Highlighting for class definitions (only the name)
-            for match in re.finditer(classes_def, line):
-                name_start = match.start(1)
-                name_end = match.end(1)
-                start = f"{current_line_index}+{name_start}c"
-                end = f"{current_line_index}+{name_end}c"
-                text_widget.tag_add("class", start, end)
-            
-            # Highlighting for URLs
-            for match in re.finditer(urls_re, line):
-                start = f"{current_line_index}+{match.start()}c"
-                end = f"{current_line_index}+{match.end()}c"
-                text_widget.tag_add("url", start, end)
+
+        # Revisiting an item (e.g. via Back/Forward) shows the same text again, so reuse its tag ranges
+        cache_key = (start_line_num, text_content)
+        ranges = self._highlight_cache.get(cache_key)
+        if ranges is not None:
+            self._highlight_cache.move_to_end(cache_key) # Mark as most recently used
+        else:
+            ranges = self._compute_highlight_ranges(text_content, start_line_num)
+            self._highlight_cache[cache_key] = ranges
+            if len(self._highlight_cache) > HIGHLIGHT_CACHE_SIZE:
+                self._highlight_cache.popitem(last=False) # Evict the least recently used entry
+
+        # Tk's tag add accepts any number of ranges, so each tag costs a single Python-to-Tcl round trip
+        for tag, tag_ranges in ranges.items():
+            if tag_ranges:
+                text_widget.tag_add(tag, *tag_ranges)
+
+    def _compute_highlight_ranges(self, text_content: str, start_line_num: int):
+        """Finds the syntax highlighting tag ranges for a block of text.
+
+        Args:
+            text_content (str): The text to scan.
+            start_line_num (int): The widget line number on which the text starts.
+
+        Returns:
+            dict: Maps each tag in _HIGHLIGHT_TAGS to a flat list of "line.column" start/end indices.
+        """
+        # Offsets at which each line starts, so a match offset maps to (line, column) with a bisect
+        line_starts = [0]
+        newline = text_content.find('\n')
+        while newline != -1:
+            line_starts.append(newline + 1)
+            newline = text_content.find('\n', newline + 1)
+
+        # Collected "start end" index pairs per tag, added with one Tk call per tag at the end
+        ranges = {tag: [] for tag in _HIGHLIGHT_TAGS}
+
+        def add_tag(tag, start_offset, end_offset):
+            line = bisect.bisect_right(line_starts, start_offset) - 1 # Matches never span lines
+            # Plain "line.column" indices; Tk resolves them directly instead of walking "+Nc" characters
+            line_num = start_line_num + line
+            ranges[tag].append(f"{line_num}.{start_offset - line_starts[line]}")
+            ranges[tag].append(f"{line_num}.{end_offset - line_starts[line]}")
+
+        # Scan the whole range once and dispatch each token on the name of the group that matched
+        for match in _HIGHLIGHT_RE.finditer(text_content):
+            kind = match.lastgroup
+            if kind == "fdef":
+                # Highlight 'def' as a keyword and only the name as a function
+                add_tag("keyword", match.start(), match.start() + 3)
+                add_tag("function", match.start("fname"), match.end("fname"))
+            elif kind == "cdef":
+                # Highlight 'class' as a keyword and only the name as a class
+                add_tag("keyword", match.start(), match.start() + 5)
+                add_tag("class", match.start("cname"), match.end("cname"))
+            elif kind == "word":
+                word = match.group()
+                if word in _KEYWORDS:
+                    add_tag("keyword", match.start(), match.end())
+                elif word in _BUILTINS:
+                    add_tag("builtin", match.start(), match.end())
+            else:
+                add_tag(kind, match.start(), match.end())
+                if kind == "string" or kind == "comment":
+                    # Links inside strings and comments stay clickable
+                    for url_match in _URL_RE.finditer(text_content, match.start(), match.end()):
+                        add_tag("url", url_match.start(), url_match.end())
+        return ranges
 
     def _open_url(self, event: tk.Event):
         """Event handler for clicking on a URL-tagged text in the info_text widget.
@@ -905,29 +1556,15 @@ class PythonHelperGUI:
         
         # Check if the clicked index has the "url" tag applied
         if "url" in self.info_text.tag_names(index):
-            # Get the full text of the line where the click occurred
-            line_start_index = self.info_text.index(f"{index} linestart")
-            line_end_index = self.info_text.index(f"{index} lineend")
-            line_text = self.info_text.get(line_start_index, line_end_index)
-
-            # Find all URLs on that line
-            urls_on_line = re.findall(r'https?://[^\s<>"]+|www\.[^\s<>"]+', line_text)
-            
-            # Determine the column of the click within the line
-            clicked_column = int(index.split('.')[1])
-            
-            # Iterate through found URLs to see which one was clicked
-            for url in urls_on_line:
-                start_match = line_text.find(url)
-                end_match = start_match + len(url)
-                
-                # Check if the click was within the bounds of this URL
-                if start_match <= clicked_column < end_match:
-                    try:
-                        webbrowser.open_new_tab(url)  # Open the URL in the default web browser
-                    except Exception as e:
-                        messagebox.showerror("Error Opening URL", f"Could not open URL: {url}\nError: {e}")
-                    return # Exit after opening the first matching URL
+            # The highlighter tagged exactly the URL's characters, so the tag range is the URL
+            url_range = self.info_text.tag_prevrange("url", f"{index}+1c")
+            if url_range:
+                url = self.info_text.get(*url_range)
+                try:
+                    import webbrowser  # Imported on first use
+                    webbrowser.open_new_tab(url)  # Open the URL in the default web browser
+                except Exception as e:
+                    messagebox.showerror("Error Opening URL", f"Could not open URL: {url}\nError: {e}")
 
     def _handle_listbox_select(self, event: tk.Event):
         """Handles selection events in the main listbox.
@@ -945,13 +1582,7 @@ class PythonHelperGUI:
         item_name_with_prefix = self.menu_listbox.get(selected_indices[0])  # Get the text of the selected item
 
         # Determine the category based on the prefix of the item name
-        item_category = self.current_category # Default to current category
-        if item_name_with_prefix.startswith("STANDARD: "):
-            item_category = "STANDARD"
-        elif item_name_with_prefix.startswith("INSTALLED: "):
-            item_category = "INSTALLED"
-        elif item_name_with_prefix.startswith("NOT INSTALLED (PyPi): "):
-            item_category = "PYPI"
+        item_category = split_item_prefix(item_name_with_prefix)[0] or self.current_category # Default to current category
 
         # Manage navigation history. Add to history only if it's a new selection.
         if not self.history or self.history[self.history_index] != (item_category, item_name_with_prefix):
@@ -983,12 +1614,7 @@ class PythonHelperGUI:
             category, item_name_with_prefix = self.history[self.history_index] # Get the item from history
             try:
                 # Clear current selection and try to select the item in the listbox
-                self.menu_listbox.selection_clear(0, tk.END)
-                current_listbox_items = list(self.menu_listbox.get(0, tk.END))
-                if item_name_with_prefix in current_listbox_items:
-                    idx = current_listbox_items.index(item_name_with_prefix)
-                    self.menu_listbox.selection_set(idx) # Select the item
-                    self.menu_listbox.see(idx) # Scroll to make it visible
+                self._select_listbox_item(item_name_with_prefix)
                 
                 # Display info for the item, explicitly not adding to history to avoid loops
                 self.display_info(item_name_with_prefix, category, add_to_history=False)
@@ -1005,12 +1631,7 @@ class PythonHelperGUI:
             category, item_name_with_prefix = self.history[self.history_index] # Get the item from history
             try:
                 # Clear current selection and try to select the item in the listbox
-                self.menu_listbox.selection_clear(0, tk.END)
-                current_listbox_items = list(self.menu_listbox.get(0, tk.END))
-                if item_name_with_prefix in current_listbox_items:
-                    idx = current_listbox_items.index(item_name_with_prefix)
-                    self.menu_listbox.selection_set(idx) # Select the item
-                    self.menu_listbox.see(idx) # Scroll to make it visible
+                self._select_listbox_item(item_name_with_prefix)
 
                 # Display info for the item, explicitly not adding to history to avoid loops
                 self.display_info(item_name_with_prefix, category, add_to_history=False)
@@ -1020,153 +1641,176 @@ class PythonHelperGUI:
                 self.history_index -= 1 # If error, revert history index
             self._update_history_buttons() # Update button states
 
+    def _set_listbox_items(self, items):
+        """Replaces the contents of the main listbox.
+
+        Args:
+            items (list of str): The entries to show, in display order.
+        """
+        # Setting the list variable hands Tcl a single list object; no delete, and no insert with N arguments
+        self._listbox_var.set(tuple(items))
+        self._listbox_items = items
+        self._listbox_index = None # Position lookup, rebuilt on first use by _select_listbox_item
+
+    def _select_listbox_item(self, item_name_with_prefix: str):
+        """Selects and scrolls to an entry of the main listbox, if it is currently shown.
+
+        Args:
+            item_name_with_prefix (str): The listbox entry text.
+        """
+        self.menu_listbox.selection_clear(0, tk.END)
+        if self._listbox_index is None:
+            # Map entries to positions once per listing, so Back/Forward don't scan the whole list
+            self._listbox_index = {item: i for i, item in enumerate(self._listbox_items)}
+        idx = self._listbox_index.get(item_name_with_prefix)
+        if idx is not None:
+            self.menu_listbox.selection_set(idx) # Select the item
+            self.menu_listbox.see(idx) # Scroll to make it visible
+
     def show_standard(self):
         """Displays Python's standard built-in commands in the listbox."""
         self.save_user_notes() # Save any open notes before changing display
-        self.menu_listbox.delete(0, tk.END)  # Clear the listbox
-        for cmd in self.standard_commands:
-            self.menu_listbox.insert(tk.END, cmd) # Insert each standard command
+        self._set_listbox_items(self.standard_commands) # Replace the listbox contents with the standard commands
         self.current_category = "STANDARD"  # Set the current category
         self.status_bar.config(text="Showing Standard Python Commands.") # Update status bar
         self.menu_listbox.selection_clear(0, tk.END) # Clear any previous listbox selection
 
     def update_installed_modules(self):
-        """Updates the cache of installed Python modules using `pip freeze`.
+        """Updates the cache of installed Python modules from the installed distributions' metadata.
         
-        This method compares the currently installed packages with the cached list
-        and re-inspects modules if changes are detected, or if the cache is expired.
+        This method compares the currently installed packages and their versions with the
+        cached ones and re-inspects the added or upgraded modules, or all of them if the cache is expired.
+        The work runs on a background thread; the listbox is refreshed when it finishes.
         """
-        try:
-            self.status_bar.config(text="Checking installed packages (this may take a moment)...")
-            self.master.update_idletasks() # Force GUI update
-            
-            # Run 'pip freeze' to get a list of all installed packages
-            result = subprocess.run(
-                [sys.executable, '-m', 'pip', 'freeze'],
-                capture_output=True, text=True, check=True,
-                encoding='utf-8', errors='ignore'
-            )
-            installed_packages_lines = result.stdout.strip().split('\n')
-            
-            current_installed_names = []
-            for line in installed_packages_lines:
-                if '==' in line: # Parse package name from 'package==version' format
-                    package_name = line.split('==')[0].strip()
-                    if package_name:
-                        current_installed_names.append(package_name)
-            current_installed_names = sorted(list(set(current_installed_names))) # Get unique, sorted names
-
-            cached_package_names = sorted(list(self.installed_modules_cache.keys()))
-
-            # Only re-inspect if the list of installed packages has changed or cache is empty
-            if current_installed_names != cached_package_names:
-                self.status_bar.config(text="Changes detected! Re-inspecting installed packages... This may take a moment.")
-                self.master.update_idletasks()
-
-                new_cache = {}
-                # Iterate through current installed packages
-                for pkg in current_installed_names:
-                    # Skip common build/utility packages that aren't typically documented by users
-                    if pkg.lower() in ['pip', 'setuptools', 'wheel', 'distlib', 'filelock', 'platformdirs', 'virtualenv', 'colorama', 'tqdm', 'certifi', 'charset-normalizer', 'idna', 'requests', 'urllib3']:
-                        continue
-                    # If package is already in cache, reuse its info
-                    if pkg in self.installed_modules_cache:
-                        new_cache[pkg] = self.installed_modules_cache[pkg]
-                    else:
-                        # Otherwise, inspect the module to get its functions, classes, etc.
-                        new_cache[pkg] = self._get_module_info(pkg)
-                    self.status_bar.config(text=f"Inspecting installed: {pkg}...")
-                    self.master.update_idletasks()
-                self.installed_modules_cache = new_cache # Update the cache
-                save_cache(self.installed_modules_cache, INSTALLED_CACHE_FILE) # Save the updated cache to disk
-                self.status_bar.config(text="Installed packages cache updated.")
-            else:
-                self.status_bar.config(text="Installed packages cache is up to date.")
+        self._run_in_background(self._collect_installed_modules, self._installed_modules_collected)
 
-        except FileNotFoundError:
-            self.status_bar.config(text="Error: 'pip' command not found. Ensure pip is installed and in your system's PATH.")
-            messagebox.showerror("Pip Error", "Error: 'pip' command not found. Ensure pip is installed and in your system's PATH.")
-        except subprocess.CalledProcessError as e:
-            self.status_bar.config(text=f"Error listing installed packages: {e}")
-            messagebox.showerror("Pip Error", f"Error listing installed packages: {e.stderr}")
-        except Exception as e:
-            self.status_bar.config(text=f"An unexpected error occurred during installed module update: {e}")
-            messagebox.showerror("Error", f"An unexpected error occurred during installed module update: {e}")
+    def _collect_installed_modules(self):
+        """Worker-thread task: re-inspects installed packages if they changed and saves the cache.
+
+        Returns:
+            dict or None: The new installed modules cache, or None if it is already up to date
+            or the window was closed before the inspection finished.
+        """
+        self._post_status("Checking installed packages (this may take a moment)...")
+        import importlib.metadata
+
+        # Read installed package names and versions in-process from their metadata (no 'pip freeze' subprocess).
+        # Each .metadata access reads and parses the METADATA file again, so it is read once per distribution.
+        current_versions = {}
+        for dist in importlib.metadata.distributions():
+            metadata = dist.metadata
+            name = metadata['Name']
+            # Skip broken installs whose metadata has no name, and common build/utility packages
+            # that aren't typically documented by users
+            if not name or name.lower() in _SKIP_PACKAGES:
+                continue
+            current_versions.setdefault(name, metadata['Version']) # The first one on sys.path is the one imported
+
+        # Only re-inspect if a package was added, removed or changed version, or the cache is empty.
+        # Entries cached before versions were recorded have no 'version' and so count as changed.
+        cached_versions = {pkg: info.get("version") for pkg, info in self.installed_modules_cache.items()}
+        if current_versions == cached_versions:
+            return None
 
-    def _get_module_info(self, module_name: str):
-        """Inspects a Python module to extract its functions, classes, submodules, and docstring.
+        # Diff the two snapshots with set operations on the dict views: only (name, version) pairs that are
+        # not cached need inspecting, and every other cached entry is kept unless its package was removed.
+        pkgs_to_inspect = sorted(pkg for pkg, _ in current_versions.items() - cached_versions.items())
+        removed = cached_versions.keys() - current_versions.keys()
+        self._post_status(f"Changes detected! {len(pkgs_to_inspect)} new or upgraded, {len(removed)} removed. "
+                          "Re-inspecting installed packages... This may take a moment.")
+        new_cache = {pkg: info for pkg, info in self.installed_modules_cache.items() if pkg not in removed}
+
+        # Inspect the new or upgraded modules to get their functions, classes, etc. Each package is imported in a
+        # short-lived worker process, so several are inspected at once on separate cores and the imports
+        # don't stay loaded in the GUI process. Workers are spawned rather than forked from this threaded process.
+        if pkgs_to_inspect:
+            workers = min(INSPECT_WORKERS, len(pkgs_to_inspect))
+            # A multiprocessing pool (unlike ProcessPoolExecutor) can be terminated, which kills workers stuck
+            # in a package that hangs on import (network I/O, a server, ...) or waiting on a crashed one.
+            with multiprocessing.get_context("spawn").Pool(workers) as pool: # Leaving the block terminates the pool
+                results = [pool.apply_async(inspect_module, (pkg,)) for pkg in pkgs_to_inspect]
+                for pkg, result in zip(pkgs_to_inspect, results):
+                    self._post_status(f"Inspecting installed: {pkg}...")
+                    # Wait in short steps rather than one long get(), so closing the window is noticed promptly
+                    deadline = time.monotonic() + INSPECT_TIMEOUT_SECONDS
+                    while not result.ready() and not self._closing.is_set() and time.monotonic() < deadline:
+                        result.wait(BACKGROUND_POLL_MS / 1000)
+                    if self._closing.is_set():
+                        pool.terminate() # Kill the workers now instead of inspecting the remaining packages
+                        return None
+                    try:
+                        info = result.get(timeout=0) # Ready, unless the deadline passed
+                    except multiprocessing.TimeoutError:
+                        print(f"Inspecting {pkg} timed out after {INSPECT_TIMEOUT_SECONDS} seconds.")
+                        info = {"functions": [], "classes": [], "modules": [],
+                                "doc": f"Inspecting module '{pkg}' timed out; it may do slow work when imported."}
+                    info["version"] = current_versions[pkg] # Recorded so an upgrade is noticed next time
+                    new_cache[pkg] = info
+        save_cache(new_cache, INSTALLED_CACHE_FILE) # Save the updated cache to disk
+        return new_cache
+
+    def _installed_modules_collected(self, future: concurrent.futures.Future):
+        """Tk-thread callback: applies the result of _collect_installed_modules.
 
         Args:
-            module_name (str): The name of the module to inspect.
-
-        Returns:
-            dict: A dictionary containing 'functions', 'classes', 'modules' lists, and 'doc'.
+            future (concurrent.futures.Future): The finished background task.
         """
-        info = {"functions": [], "classes": [], "modules": [], "doc": "No module documentation available."}
         try:
-            module = importlib.import_module(module_name) # Dynamically import the module
-            info["doc"] = inspect.getdoc(module) or "No module documentation available." # Get module-level docstring
-
-            # Iterate through members of the module
-            for name, obj in inspect.getmembers(module):
-                if name.startswith('_'): # Skip private/special members
-                    continue
-                # Heuristic to skip very common standard library modules or internal modules
-                # that are less likely to be individually looked up by users or lead to excessive inspection
-                if hasattr(obj, '__module__') and obj.__module__ and obj.__module__.split('.')[0] in ['tkinter', 'sys', 'os', 'builtins', 'json', 'requests',
-                                                     'subprocess', 'inspect', 'site', 'time', 'html', 'collections', 'io',
-                                                     'abc', 'typing', 'enum', 'types', 'weakref', 'functools', 'operator',
-                                                     'math', 'itertools', 're', 'copy', 'decimal', 'datetime', 'hashlib',
-                                                     'random', 'socket', 'threading', 'queue', 'logging', 'warnings',
-                                                     'xml', 'html', 'http', 'ssl', 'urllib', 'json', 'uuid', 'zipfile',
-                                                     'tarfile', 'shutil', 'tempfile', 'pathlib', 'glob', 'fnmatch',
-                                                     'platform', 'getpass', 'mimetypes', 'locale', 'codecs', 'contextlib',
-                                                     'asyncio', 'selectors', 'collections.abc', 'struct', 'array', 'binascii',
-                                                     'zlib', 'gzip', 'bz2', 'lzma', 'pickle', 'sqlite3', 'csv', 'xml.etree',
-                                                     'json.tool', 'venv', 'dis', 'pprint', 'traceback', 'code', 'cmd', 'pdb',
-                                                     'profile', 'pstats', 'test', 'unittest', 'doctest', 'test.support',
-                                                     'lib2to3', 'distutils', 'setuptools', 'packaging', 'pip', 'wheel']:
-                    continue
-
-                # Categorize members
-                if inspect.isfunction(obj):
-                    info["functions"].append(name)
-                elif inspect.isclass(obj):
-                    info["classes"].append(name)
-                elif inspect.ismodule(obj):
-                    info["modules"].append(name)
-        except ImportError:
-            # Handle modules that cannot be imported (e.g., C extensions, non-importable packages)
-            print(f"Could not import {module_name}. It might not be directly importable or is a namespace package.")
-            info["doc"] = f"Could not import module '{module_name}'. It might be a namespace package or requires specific import syntax."
+            new_cache = future.result()
+            if new_cache is None:
+                self.status_bar.config(text="Installed packages cache is up to date.")
+                return
+            self.installed_modules_cache = new_cache # Update the cache
+            reflect_member.cache_clear() # Installed packages changed, so memoized reflection may be stale
+            self._rebuild_search_index() # Likewise the search index
+            self.status_bar.config(text="Installed packages cache updated.")
+            # If the user was viewing the installed category, refresh the listbox
+            if self.current_category == "INSTALLED":
+                self.show_installed()
         except Exception as e:
-            # Catch any other inspection errors
-            print(f"Error inspecting {module_name}: {e}")
-            info["doc"] = f"Error inspecting module '{module_name}': {e}"
-        return info
+            self.status_bar.config(text=f"An unexpected error occurred during installed module update: {e}")
+            messagebox.showerror("Error", f"An unexpected error occurred during installed module update: {e}")
 
     def show_installed(self):
         """Displays installed Python modules and their members in the listbox."""
         self.save_user_notes() # Save any open notes
-        self.menu_listbox.delete(0, tk.END) # Clear listbox
-        display_items = set() # Use a set to store unique items before sorting
+        # Module names are unique cache keys and each member name is listed once per module,
+        # so the entries need no de-duplicating set; they are collected in a list and sorted once.
+        display_items = []
+        extend = display_items.extend
 
         # Add top-level modules and their members to the display list
         for module_name, info in self.installed_modules_cache.items():
-            display_items.add(module_name)
-            for func in info.get("functions", []):
-                display_items.add(f"{module_name}.{func}") # Format as module.function
-            for cls in info.get("classes", []):
-                display_items.add(f"{module_name}.{cls}") # Format as module.class
-            for mod in info.get("modules", []):
-                display_items.add(f"{module_name}.{mod}") # Format as module.submodule
-
-        for item in sorted(list(display_items)): # Sort and insert into listbox
-            self.menu_listbox.insert(tk.END, item)
+            display_items.append(module_name)
+            extend(f"{module_name}.{func}" for func in info.get("functions", [])) # Format as module.function
+            extend(f"{module_name}.{cls}" for cls in info.get("classes", [])) # Format as module.class
+            extend(f"{module_name}.{mod}" for mod in info.get("modules", [])) # Format as module.submodule
+
+        display_items.sort()
+        self._set_listbox_items(display_items) # Show in the listbox
         self.current_category = "INSTALLED" # Set current category
         self.status_bar.config(text="Showing Installed Modules.") # Update status bar
         self.menu_listbox.selection_clear(0, tk.END) # Clear any previous selection
 
+    @property
+    def http_session(self):
+        """The shared HTTP session for PyPI, created (and requests imported) on first access.
+
+        Returns:
+            requests.Session: The session, with a connection pool sized for PYPI_FETCH_WORKERS and two more.
+        """
+        with self._http_session_lock: # Worker threads may ask for the session at the same time
+            if self._http_session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                session = requests.Session()
+                # Every request goes to pypi.org, so one host pool holding a kept-alive connection per fetch worker
+                # (plus the index download and the Tk thread's own lookups) is enough; clicks after the first
+                # reuse an open TLS connection instead of handshaking again.
+                session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=PYPI_FETCH_WORKERS + 2))
+                self._http_session = session
+            return self._http_session
+
     def _fetch_pypi_package_details(self, package_name: str):
         """Fetches detailed information for a PyPI package from PyPI's JSON API.
 
@@ -1178,22 +1822,15 @@ class PythonHelperGUI:
         Returns:
             dict or None: The package details dictionary if successful, None otherwise.
         """
-        # Create a safe filename for caching, replacing problematic characters
-        safe_package_name = re.sub(r'[\\/:*?"<>|.]', '_', package_name)
-        detail_cache_file = os.path.join(PYPI_DETAIL_CACHE_DIR, f"{safe_package_name}.json")
-
-        cached_data = load_cache(detail_cache_file, "pypi_detail") # Try to load from cache first
+        cached_data = load_pypi_detail_cache(package_name) # Try to load from cache first
         if cached_data:
             return cached_data
 
+        import requests # Only needed once PyPI has to be contacted
         try:
             self.status_bar.config(text=f"Fetching PyPI details for '{package_name}'...")
             self.master.update_idletasks()
-            # Make an HTTP GET request to the PyPI JSON API
-            response = requests.get(f"https://pypi.org/pypi/{package_name}/json", timeout=5)
-            response.raise_for_status() # Raise an HTTPError for bad responses (4xx or 5xx)
-            data = response.json() # Parse the JSON response
-            save_cache(data, detail_cache_file) # Save the fetched data to cache
+            data = self._download_pypi_package_details(package_name)
             self.status_bar.config(text=f"PyPI details for '{package_name}' fetched and cached.")
             return data
         except requests.exceptions.RequestException as e:
@@ -1209,41 +1846,186 @@ class PythonHelperGUI:
             print(f"An unexpected error fetching PyPI details for '{package_name}': {e}")
             return None
 
+    def _download_pypi_package_details(self, package_name: str):
+        """Downloads a PyPI package's details from the JSON API and caches them.
+
+        An expired cached copy is reused (and its expiry reset) if PyPI answers a conditional
+        request with 304 Not Modified, or, when no ETag is stored, lists no new releases.
+        This does not touch any Tkinter widgets, so it is safe to call from worker threads.
+
+        Args:
+            package_name (str): The name of the PyPI package.
+
+        Returns:
+            dict: The package details dictionary.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails.
+            json.JSONDecodeError: If the response is not valid JSON.
+        """
+        import requests
+        detail_cache_file = pypi_detail_cache_file(package_name)
+        headers = {}
+        # If an expired copy exists, try to revalidate it instead of downloading everything again.
+        # The ETag from the response that produced the cache is stored alongside the data.
+        stale_entry = load_cache(detail_cache_file, "pypi_detail", ignore_expiry=True) or {}
+        stale_data = stale_entry.get("data")
+        if stale_data:
+            etag = stale_entry.get("etag")
+            if etag:
+                headers["If-None-Match"] = etag # PyPI answers 304 (no body) if nothing changed
+            elif "releases" in stale_data:
+                # No ETag stored: check the small simple-index listing; if no new release has
+                # appeared, the old details are still current and the full download is skipped.
+                try:
+                    versions = self._fetch_pypi_versions(package_name)
+                except (requests.exceptions.RequestException, ValueError) as e:
+                    print(f"Could not check PyPI versions for '{package_name}': {e}")
+                    versions = None
+                if versions is not None and set(versions) == set(stale_data["releases"]):
+                    self._renew_pypi_detail_cache(package_name, detail_cache_file)
+                    return stale_data
+
+        # Make an HTTP GET request to the PyPI JSON API over the shared session
+        response = self.http_session.get(f"https://pypi.org/pypi/{package_name}/json", headers=headers, timeout=5)
+        if response.status_code == 304 and stale_data:
+            self._renew_pypi_detail_cache(package_name, detail_cache_file)
+            return stale_data
+        response.raise_for_status() # Raise an HTTPError for bad responses (4xx or 5xx)
+        data = decode_json(response.content) # Parse the JSON response
+        # Save the fetched data and its ETag to cache in one file, so they can never disagree
+        save_cache({"etag": response.headers.get("ETag"), "data": data}, detail_cache_file)
+        remember_pypi_details(package_name, data) # Replaces only this package's memoized details
+        return data
+
+    def _renew_pypi_detail_cache(self, package_name: str, detail_cache_file: str):
+        """Marks an expired PyPI detail cache as fresh again after PyPI confirmed it is unchanged.
+
+        Args:
+            package_name (str): The name of the PyPI package.
+            detail_cache_file (str): The full path to the detail cache file.
+        """
+        os.utime(detail_cache_file) # Touch the cache file to restart its expiry period
+        forget_pypi_details(package_name) # The next lookup reads the renewed file
+
+    def _fetch_pypi_versions(self, package_name: str):
+        """Fetches the list of released versions of a PyPI package from the simple index.
+
+        Uses the JSON form of the simple API (PEP 691/700), whose response is a small
+        listing of files and versions rather than the full package metadata.
+
+        Args:
+            package_name (str): The name of the PyPI package.
+
+        Returns:
+            list of str: The package's released versions.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails.
+            ValueError: If the response is not valid JSON.
+        """
+        response = self.http_session.get(
+            f"https://pypi.org/simple/{package_name}/",
+            headers={"Accept": "application/vnd.pypi.simple.v1+json"},
+            timeout=5
+        )
+        response.raise_for_status()
+        return decode_json(response.content).get("versions", [])
+
+    def _prefetch_pypi_package(self, package_name: str):
+        """Worker-thread task: caches a package's PyPI details unless a fresh copy is already cached.
+
+        Skipped if the package is no longer among the rows of the latest prefetch_pypi_details call,
+        e.g. because the live filter moved on while it was queued.
+
+        Args:
+            package_name (str): The name of the PyPI package.
+        """
+        try:
+            if self._closing.is_set() or self._pypi_prefetching.get(package_name) != self._prefetch_generation:
+                return # Shutting down, or the rows that wanted it are no longer listed
+            if load_pypi_detail_cache(package_name) is not None:
+                return # Already cached
+            self._download_pypi_package_details(package_name)
+        except Exception as e:
+            # Prefetching is best-effort; a click on the package will retry and report errors
+            print(f"Error prefetching PyPI details for '{package_name}': {e}")
+        finally:
+            with self._pypi_prefetching_lock:
+                del self._pypi_prefetching[package_name]
+
+    def prefetch_pypi_details(self, package_names):
+        """Fetches details for several PyPI packages in parallel in the background.
+
+        Requests run on the shared thread pool (up to PYPI_FETCH_WORKERS at a time), so
+        N lookups take roughly as long as the slowest one instead of the sum of all of them.
+        Each call supersedes the previous one: its queued packages that are not asked for
+        again here are skipped when their turn comes.
+
+        Args:
+            package_names (iterable of str): The PyPI package names to fetch.
+        """
+        self._prefetch_generation += 1
+        for package_name in package_names:
+            with self._pypi_prefetching_lock:
+                queued = package_name in self._pypi_prefetching
+                self._pypi_prefetching[package_name] = self._prefetch_generation # Still wanted by the current rows
+            if not queued: # Otherwise already on its way, e.g. the top rows while the live filter narrows
+                self._pypi_fetch_executor.submit(self._prefetch_pypi_package, package_name)
+
     def fetch_pypi_packages(self):
         """Fetches the list of all available packages from PyPI's simple index.
         
         This list is used for the "NOT INSTALLED (PyPI)" category.
+        The download runs on a background thread; the listbox is refreshed when it finishes.
         """
         self.status_bar.config(text="Fetching PyPI package index (this might take a moment)...")
-        self.master.update_idletasks()
+        self._run_in_background(self._download_pypi_index, self._pypi_index_downloaded)
+
+    def _download_pypi_index(self):
+        """Worker-thread task: downloads and parses PyPI's simple index, then saves it to cache.
 
+        Returns:
+            tuple or None: The unique, sorted package names and their search text from build_pypi_text,
+            or None if the window was closed during the download.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails.
+        """
+        # Stream the simple HTML index page from PyPI instead of holding the whole document (and a parse tree)
+        response = self.http_session.get("https://pypi.org/simple/", stream=True, timeout=10)
+        response.raise_for_status()
+
+        names = set()
+        pending = b"" # Tail of the previous chunk that may hold a partial link
+        with response:
+            for chunk in response.iter_content(chunk_size=PYPI_INDEX_CHUNK_SIZE):
+                if self._closing.is_set():
+                    return None # The window was closed; stop reading instead of finishing a multi-MB download
+                pending += chunk
+                end = pending.rfind(b"</a>") # Only scan up to the last complete link
+                if end != -1:
+                    end += len(b"</a>")
+                    names.update(_PYPI_LINK_RE.findall(pending, 0, end)) # findall yields the captured names directly
+                    pending = pending[end:]
+        packages = sorted(name.decode('utf-8', 'replace') for name in names) # Get unique, sorted package names
+        save_cache(packages, PYPI_INDEX_CACHE_FILE, compressed=True) # Save the index to cache (about 15MB of pickle, 6MB compressed)
+        # Build the search text here too, so half a million .lower() calls do not stall the Tk thread in the callback
+        return packages, build_pypi_text(packages)
+
+    def _pypi_index_downloaded(self, future: concurrent.futures.Future):
+        """Tk-thread callback: applies the result of _download_pypi_index.
+
+        Args:
+            future (concurrent.futures.Future): The finished background task.
+        """
+        import requests # Imported here rather than at startup, which may not need the network at all
         try:
-            # Request the simple HTML index page from PyPI
-            response = requests.get("https://pypi.org/simple/", timeout=10)
-            response.raise_for_status()
-
-            # --- HTML Parsing for PyPI Index ---
-            # A simple HTML parser to extract package links from the PyPI simple index page.
-            class PackageListParser(HTMLParser):
-                def __init__(self):
-                    super().__init__()
-                    self.packages = []
-
-                def handle_starttag(self, tag, attrs):
-                    # Look for 'a' (anchor) tags which contain package links
-                    if tag == 'a':
-                        for attr, value in attrs:
-                            if attr == 'href':
-                                # Check if the href points to a package directory (e.g., /simple/package-name/)
-                                if value.startswith('/simple/') and value.endswith('/'):
-                                    package_name = value.split('/')[-2] # Extract package name from URL path
-                                    self.packages.append(package_name)
-                                break # Stop checking attributes for this tag
-
-            parser = PackageListParser()
-            parser.feed(response.text) # Feed the HTML content to the parser
-            self.pypi_index_cache = sorted(list(set(parser.packages))) # Get unique, sorted package names
-            save_cache(self.pypi_index_cache, PYPI_INDEX_CACHE_FILE) # Save the index to cache
+            result = future.result()
+            if result is None:
+                return # Stopped because the window was closed
+            self.pypi_index_cache, self._pypi_text = result
+            self._rebuild_pypi_prefix_index()
             self.status_bar.config(text="PyPI index updated from web.")
             # If the user was viewing the PyPI category, refresh the listbox
             if self.current_category == "PYPI":
@@ -1255,15 +2037,125 @@ class PythonHelperGUI:
             self.status_bar.config(text=f"An unexpected error occurred during PyPI fetch: {e}")
             messagebox.showerror("Error", f"An unexpected error occurred during PyPI fetch: {e}")
 
+    def _run_in_background(self, work, on_done, executor=None):
+        """Runs a task on a worker thread and hands its result back to the Tk thread.
+
+        Tk widgets may only be touched from the thread running the main loop, so `work`
+        must not use them (it can report progress with _post_status). The future is polled
+        with `after`, and `on_done(future)` is called on the Tk thread once it completes.
+
+        Args:
+            work (callable): The task to run; takes no arguments.
+            on_done (callable): Called with the finished concurrent.futures.Future.
+            executor (concurrent.futures.Executor, optional): Where to run the task.
+                Defaults to None (the shared background executor).
+        """
+        future = (executor or self._background_executor).submit(work)
+        self.master.after(BACKGROUND_POLL_MS, self._poll_background_task, future, on_done)
+
+    def _poll_background_task(self, future: concurrent.futures.Future, on_done):
+        """Shows posted worker status and calls `on_done` once the future has completed."""
+        status = self._background_status
+        if status is not None:
+            self._background_status = None
+            self.status_bar.config(text=status)
+        if future.done():
+            on_done(future)
+        else:
+            self.master.after(BACKGROUND_POLL_MS, self._poll_background_task, future, on_done)
+
+    def _post_status(self, text: str):
+        """Sets the status bar text from a worker thread (shown on the next poll).
+
+        Args:
+            text (str): The status message.
+        """
+        self._background_status = text
+
     def show_pypi(self):
         """Displays the list of PyPI packages (not installed) in the listbox."""
         self.save_user_notes() # Save any open notes
-        self.menu_listbox.delete(0, tk.END) # Clear listbox
-        for package in self.pypi_index_cache:
-            self.menu_listbox.insert(tk.END, package) # Insert each package name
+        # The full index has hundreds of thousands of names; materializing them all in the listbox costs a lot of
+        # Tk memory and slows scrolling, and users find packages by typing anyway (see _filter_pypi_listbox).
+        total = len(self.pypi_index_cache)
+        self._set_listbox_items(self.pypi_index_cache[:PYPI_LIST_LIMIT]) # Replace the listbox contents with the package names
         self.current_category = "PYPI" # Set current category
-        self.status_bar.config(text=f"Showing {len(self.pypi_index_cache)} PyPI Packages.") # Update status bar
+        if total > PYPI_LIST_LIMIT:
+            self.status_bar.config(text=f"Showing the first {PYPI_LIST_LIMIT} of {total} PyPI Packages. Type to filter.")
+        else:
+            self.status_bar.config(text=f"Showing {total} PyPI Packages.") # Update status bar
         self.menu_listbox.selection_clear(0, tk.END) # Clear any previous selection
+        # Warm the detail cache for the rows at the top of the list so clicking one is instant
+        self.prefetch_pypi_details(self.pypi_index_cache[:PYPI_PREFETCH_LIMIT])
+
+    def _schedule_pypi_filter(self, event: tk.Event = None):
+        """Restarts the debounce timer for the live PyPI filter after each key release.
+
+        Only active while the PyPI category is shown; other categories use the Search button.
+
+        Args:
+            event (tk.Event, optional): The key event. Defaults to None.
+        """
+        if self.current_category != "PYPI":
+            return
+        if self._pypi_filter_after_id is not None:
+            self.master.after_cancel(self._pypi_filter_after_id) # The user is still typing
+        self._pypi_filter_after_id = self.master.after(SEARCH_DEBOUNCE_MS, self._filter_pypi_listbox)
+
+    def _filter_pypi_listbox(self):
+        """Shows the first PYPI_FILTER_LIMIT PyPI packages whose names contain the search text."""
+        self._pypi_filter_after_id = None
+        if self.current_category != "PYPI":
+            return # The category changed while the filter was pending
+        query = self.search_entry.get().lower().strip()
+        if not query:
+            self.show_pypi() # Back to the full list
+            return
+        # Scan the index on a worker thread so typing stays responsive
+        work = functools.partial(match_pypi_packages, self.pypi_index_cache, self._pypi_text, query,
+                                 PYPI_FILTER_LIMIT, self._pypi_prefix_index)
+        self._run_in_background(work, functools.partial(self._pypi_filter_done, query), self._search_executor)
+
+    def _rebuild_pypi_prefix_index(self):
+        """Drops the PyPI prefix index and sorts the current names for a new one on a background thread."""
+        self._pypi_prefix_index = None
+        packages = self.pypi_index_cache
+        work = functools.partial(build_prefix_index, self._pypi_text)
+        self._run_in_background(work, functools.partial(self._pypi_prefix_index_built, packages))
+
+    def _pypi_prefix_index_built(self, packages: list, future: concurrent.futures.Future):
+        """Tk-thread callback: installs the index from _rebuild_pypi_prefix_index unless it is outdated.
+
+        Args:
+            packages (list of str): The PyPI index the prefix index was built from.
+            future (concurrent.futures.Future): The finished background task.
+        """
+        if packages is not self.pypi_index_cache:
+            return # Skip it: a new PyPI index arrived meanwhile
+        try:
+            self._pypi_prefix_index = future.result()
+        except Exception as e:
+            # The live filter still works without it, by scanning
+            self.status_bar.config(text=f"An unexpected error occurred while indexing PyPI package names: {e}")
+
+    def _pypi_filter_done(self, query: str, future: concurrent.futures.Future):
+        """Tk-thread callback: shows the PyPI packages found by _filter_pypi_listbox.
+
+        Args:
+            query (str): The search text the matches were computed for.
+            future (concurrent.futures.Future): The finished background task.
+        """
+        if self.current_category != "PYPI" or self.search_entry.get().lower().strip() != query:
+            return # Outdated: the category or the search text changed in the meantime
+        try:
+            matches = future.result()
+        except Exception as e:
+            self.status_bar.config(text=f"An unexpected error occurred while filtering PyPI packages for '{query}': {e}")
+            return
+        self._set_listbox_items(matches)
+        self.status_bar.config(text=f"Showing {len(matches)} PyPI packages matching '{query}'.")
+        self.menu_listbox.selection_clear(0, tk.END)
+        self.prefetch_pypi_details(matches[:PYPI_PREFETCH_LIMIT]) # Warm the detail cache for the top matches
 
     def display_info(self, raw_selected_item: str, item_category_override: str = None, add_to_history: bool = True):
         """Displays detailed information for a selected item (command, module, or PyPI package).
@@ -1277,28 +2169,22 @@ class PythonHelperGUI:
             add_to_history (bool, optional): If True, add this display event to navigation history.
                                            Defaults to True. Set to False for back/forward actions.
         """
+        import inspect
         # Save user notes if a new item is being displayed and it's not a history navigation event
         if add_to_history and self.current_selected_item and self.current_selected_item != raw_selected_item:
              self.save_user_notes() 
 
         # Determine the actual item name and its category by stripping prefixes
         item_type = item_category_override if item_category_override else self.current_category
-        item_name = raw_selected_item
-
-        if raw_selected_item.startswith("INSTALLED: "):
-            item_type = "INSTALLED"
-            item_name = raw_selected_item.replace("INSTALLED: ", "")
-        elif raw_selected_item.startswith("NOT INSTALLED (PyPi): "):
-            item_type = "PYPI"
-            item_name = raw_selected_item.replace("NOT INSTALLED (PyPi): ", "")
-        elif raw_selected_item.startswith("STANDARD: "):
-            item_type = "STANDARD"
-            item_name = raw_selected_item.replace("STANDARD: ", "")
+        prefix_category, item_name = split_item_prefix(raw_selected_item)
+        if prefix_category:
+            item_type = prefix_category
 
         self.info_text.delete(1.0, tk.END) # Clear previous content in the info text area
         self.current_selected_item = item_name # Update the currently selected item
 
-        info_to_display = [] # List to build the display text
+        info_to_display = io.StringIO() # Buffer to build the display text
+        write = info_to_display.write
 
         if item_type == "INSTALLED":
             # Handle installed modules and their members (functions, classes, submodules)
@@ -1309,179 +2195,138 @@ class PythonHelperGUI:
                 member_name = parts[1]
 
                 try:
-                    module = importlib.import_module(module_name) # Import the parent module
-                    obj = getattr(module, member_name) # Get the specific member object
+                    # Reflection results are memoized, so revisiting a member skips import and inspect work
+                    type_name, syntax, docstring = reflect_member(module_name, member_name)
 
-                    info_to_display.append(f"Name: {member_name}\n")
-                    info_to_display.append(f"Module: {module_name}\n")
-                    info_to_display.append(f"Type: {type(obj).__name__}\n")
+                    write(f"Name: {member_name}\n")
+                    write(f"Module: {module_name}\n")
+                    write(f"Type: {type_name}\n")
                     
-                    info_to_display.append(f"\nSyntax:\n")
-                    try:
-                        # Try to get the signature for functions, classes, and methods
-                        if inspect.isfunction(obj) or inspect.isclass(obj) or inspect.ismethod(obj):
-                            signature = inspect.signature(obj) # Get the function/method signature
-                            info_to_display.append(f"  {member_name}{signature}\n\n")
-                            
-                            # Display parameters if available in the signature
-                            if signature.parameters:
-                                info_to_display.append("Parameters:\n")
-                                for name, param in signature.parameters.items():
-                                    param_info = f"  - {name}"
-                                    if param.annotation != inspect.Parameter.empty:
-                                        # Add type hints, stripping "typing." prefix for brevity
-                                        param_info += f": {str(param.annotation).replace('typing.', '')}"
-                                    if param.default != inspect.Parameter.empty:
-                                        param_info += f" = {repr(param.default)}" # Add default value
-                                    info_to_display.append(param_info + "\n")
-                                info_to_display.append("\n")
-                            else:
-                                info_to_display.append("  (No parameters)\n\n")
-                        else:
-                            info_to_display.append("  (Syntax not directly applicable or easily determined programmatically)\n\n")
-                    except ValueError:
-                        # This typically happens for C-implemented objects where signature is not exposed
-                        info_to_display.append("  (Signature not available for this object)\n\n")
-
-                    docstring = inspect.getdoc(obj) or "No documentation available." # Get object's docstring
-                    info_to_display.append(f"Docstring:\n{docstring}\n\n")
+                    write(f"\nSyntax:\n{syntax}")
+                    write(f"Docstring:\n{docstring}\n\n")
 
                     examples = self.extract_examples_from_docstring(docstring) # Extract examples
                     if examples:
-                        info_to_display.append(f"Examples:\n{examples}\n\n")
+                        write(f"Examples:\n{examples}\n\n")
                     else:
-                        info_to_display.append("Examples: (No examples found in docstring)\n\n")
+                        write("Examples: (No examples found in docstring)\n\n")
 
                 except (ImportError, AttributeError) as e:
                     # Handle cases where module or member is not found
-                    info_to_display.append(f"Error retrieving info for {item_name}: {e}\n")
+                    write(f"Error retrieving info for {item_name}: {e}\n")
                     self.status_bar.config(text=f"Error displaying '{item_name}': {e}")
                 except Exception as e:
                     # Catch any other unexpected errors during inspection
-                    info_to_display.append(f"An unexpected error occurred for {item_name}: {e}\n")
+                    write(f"An unexpected error occurred for {item_name}: {e}\n")
                     self.status_bar.config(text=f"An unexpected error displaying '{item_name}': {e}")
             else:
                 # This is a top-level installed module
                 module_name = item_name
                 try:
-                    module = importlib.import_module(module_name)
-                    info_to_display.append(f"Module: {module_name} (Installed)\n")
-                    info_to_display.append(f"\nDocstring:\n{inspect.getdoc(module) or self.installed_modules_cache.get(module_name, {}).get('doc', 'No documentation available for this module.')}\n\n")
-                    info_to_display.append("Members (functions/classes/submodules) can be found by expanding this module in the 'INSTALLED' category or searching for specific members.\n\n")
+                    module = sys.modules.get(module_name) or importlib.import_module(module_name) # Fast path if already imported
+                    write(f"Module: {module_name} (Installed)\n")
+                    write(f"\nDocstring:\n{inspect.getdoc(module) or self.installed_modules_cache.get(module_name, {}).get('doc', 'No documentation available for this module.')}\n\n")
+                    write("Members (functions/classes/submodules) can be found by expanding this module in the 'INSTALLED' category or searching for specific members.\n\n")
                 except ImportError as e:
-                    info_to_display.append(f"Error importing module {module_name}: {e}\n")
-                    info_to_display.append(f"This might be a namespace package or requires specific import syntax. Try 'pip install {module_name}'.\n\n")
+                    write(f"Error importing module {module_name}: {e}\n")
+                    write(f"This might be a namespace package or requires specific import syntax. Try 'pip install {module_name}'.\n\n")
                     self.status_bar.config(text=f"Error importing '{module_name}': {e}")
                 except Exception as e:
-                    info_to_display.append(f"An unexpected error occurred for {module_name}: {e}\n")
+                    write(f"An unexpected error occurred for {module_name}: {e}\n")
                     self.status_bar.config(text=f"An unexpected error displaying '{module_name}': {e}")
 
+        elif item_type == "STANDARD" and item_name not in _BUILTIN_NAMESPACE:
+            # Not a built-in name (e.g. a stale history entry); a dict lookup avoids raising and catching AttributeError
+            write(f"Error retrieving info for standard command {item_name}: no built-in named '{item_name}'\n")
+            self.status_bar.config(text=f"Error displaying '{item_name}': no built-in named '{item_name}'")
+
         elif item_type == "STANDARD":
             # Handle standard built-in Python commands
             try:
-                obj = getattr(builtins, item_name) # Get the built-in object from the 'builtins' module
-                info_to_display.append(f"Name: {item_name} (Standard Python Command)\n")
-                info_to_display.append(f"Type: {type(obj).__name__}\n")
+                # Reflection results are memoized, so revisiting a command skips signature and docstring work
+                type_name, syntax, docstring = reflect_member("builtins", item_name)
+                write(f"Name: {item_name} (Standard Python Command)\n")
+                write(f"Type: {type_name}\n")
                 
                 # --- START: Custom Syntax Logic for Built-ins ---
                 # Check for a manually curated syntax override first
-                if item_name in self._builtin_syntax_override:
-                    override_data = self._builtin_syntax_override[item_name]
-                    info_to_display.append(f"\nSyntax:\n  {override_data['syntax']}\n\n")
+                override_data = _CURATED_SYNTAX.get(item_name)
+                if override_data:
+                    write(f"\nSyntax:\n  {override_data['syntax']}\n\n")
                     if override_data.get("parameters"):
-                        info_to_display.append("Parameters:\n")
+                        write("Parameters:\n")
                         for param in override_data["parameters"]:
-                            info_to_display.append(f"  - {param['name']}: {param['description']}\n")
-                        info_to_display.append("\n")
+                            write(f"  - {param['name']}: {param['description']}\n")
+                        write("\n")
                 else:
                     # Fallback to inspect.signature() for other built-ins that might work
-                    info_to_display.append(f"\nSyntax:\n")
-                    try:
-                        if inspect.isfunction(obj) or inspect.isclass(obj) or inspect.ismethod(obj):
-                            signature = inspect.signature(obj)
-                            info_to_display.append(f"  {item_name}{signature}\n\n")
-
-                            if signature.parameters:
-                                info_to_display.append("Parameters:\n")
-                                for name, param in signature.parameters.items():
-                                    param_info = f"  - {name}"
-                                    if param.annotation != inspect.Parameter.empty:
-                                        param_info += f": {str(param.annotation).replace('typing.', '')}"
-                                    if param.default != inspect.Parameter.empty:
-                                        param_info += f" = {repr(param.default)}"
-                                    info_to_display.append(param_info + "\n")
-                                info_to_display.append("\n")
-                            else:
-                                info_to_display.append("  (No parameters)\n\n")
-                        else:
-                            info_to_display.append("  (Syntax not directly applicable or easily determined programmatically)\n\n")
-                    except ValueError:
-                        info_to_display.append("  (Signature not available for this object)\n\n")
+                    write(f"\nSyntax:\n{syntax}")
                 # --- END: Custom Syntax Logic for Built-ins ---
 
-                docstring = inspect.getdoc(obj) or "No documentation available."
-                info_to_display.append(f"Docstring:\n{docstring}\n\n")
+                write(f"Docstring:\n{docstring}\n\n")
                 
                 # Prioritize curated example if available, otherwise extract from docstring
-                if item_name in self._builtin_syntax_override and self._builtin_syntax_override[item_name].get("example"):
-                    info_to_display.append(f"Examples:\n{self._builtin_syntax_override[item_name]['example']}\n\n")
+                if override_data and override_data.get("example"):
+                    write(f"Examples:\n{override_data['example']}\n\n")
                 else:
                     examples = self.extract_examples_from_docstring(docstring)
                     if examples:
-                        info_to_display.append(f"Examples:\n{examples}\n\n")
+                        write(f"Examples:\n{examples}\n\n")
                     else:
-                        info_to_display.append("Examples: (No examples found in docstring)\n\n")
+                        write("Examples: (No examples found in docstring)\n\n")
             except AttributeError as e:
-                info_to_display.append(f"Error retrieving info for standard command {item_name}: {e}\n")
+                write(f"Error retrieving info for standard command {item_name}: {e}\n")
                 self.status_bar.config(text=f"Error displaying '{item_name}': {e}")
             except Exception as e:
-                info_to_display.append(f"An unexpected error occurred for standard command {item_name}: {e}\n")
+                write(f"An unexpected error occurred for standard command {item_name}: {e}\n")
                 self.status_bar.config(text=f"An unexpected error displaying '{item_name}': {e}")
 
         elif item_type == "PYPI":
             # Handle PyPI packages (not locally installed)
-            info_to_display.append(f"Package: {item_name} (Available on PyPI)\n")
+            write(f"Package: {item_name} (Available on PyPI)\n")
             pypi_details = self._fetch_pypi_package_details(item_name) # Fetch details from PyPI or cache
             if pypi_details:
                 # Display version, summary, homepage, and other project URLs
-                info_to_display.append(f"Version: {pypi_details.get('info', {}).get('version', 'N/A')}\n")
+                write(f"Version: {pypi_details.get('info', {}).get('version', 'N/A')}\n")
                 summary = pypi_details.get('info', {}).get('summary', 'No summary available.')
-                info_to_display.append(f"Summary:\n{summary}\n\n")
+                write(f"Summary:\n{summary}\n\n")
                 
                 home_page = pypi_details.get('info', {}).get('home_page')
                 if home_page:
-                    info_to_display.append(f"Homepage: {home_page}\n")
+                    write(f"Homepage: {home_page}\n")
                 
                 project_urls = pypi_details.get('info', {}).get('project_urls')
                 if project_urls:
-                    info_to_display.append("Project URLs:\n")
+                    write("Project URLs:\n")
                     for label, url in project_urls.items():
-                        info_to_display.append(f"  {label}: {url}\n")
-                info_to_display.append("\n")
+                        write(f"  {label}: {url}\n")
+                write("\n")
             else:
-                info_to_display.append("(Could not fetch additional PyPI details. Check internet or try again later.)\n\n")
+                write("(Could not fetch additional PyPI details. Check internet or try again later.)\n\n")
 
-            info_to_display.append(f"To install: pip install {item_name}\n") # Provide installation command
-            info_to_display.append(f"More info: https://pypi.org/project/{item_name}/\n\n") # Link to PyPI page
+            write(f"To install: pip install {item_name}\n") # Provide installation command
+            write(f"More info: https://pypi.org/project/{item_name}/\n\n") # Link to PyPI page
         else:
             # Fallback for unexpected item types or search results that don't fit categories
-            info_to_display.append(f"Could not fully determine type for: {raw_selected_item}\n")
-            info_to_display.append(f"Attempted to parse as: '{item_name}', Inferred type: '{item_type}'\n\n")
-            info_to_display.append("Please select from 'STANDARD', 'INSTALLED', or 'NOT INSTALLED (PyPi)' categories directly if search results are unclear.\n")
+            write(f"Could not fully determine type for: {raw_selected_item}\n")
+            write(f"Attempted to parse as: '{item_name}', Inferred type: '{item_type}'\n\n")
+            write("Please select from 'STANDARD', 'INSTALLED', or 'NOT INSTALLED (PyPi)' categories directly if search results are unclear.\n")
 
-        # Insert all gathered information into the info_text widget
-        start_index = self.info_text.index(tk.END) # Get the current end index before inserting
-        self.info_text.insert(tk.END, "".join(info_to_display))
-        end_index = self.info_text.index(tk.END) # Get the new end index after inserting
-
-        self._apply_syntax_highlighting(self.info_text, start_index, end_index) # Apply highlighting
-
-        # Add the "Your Notes" separator and load/display user notes
-        notes_section_marker = f"\n{'-'*15} Your Notes {'-'*15}\n"
-        self.info_text.insert(tk.END, notes_section_marker)
-        
+        # Add the "Your Notes" separator and load user notes, then insert everything in one Tk call
+        info_content = info_to_display.getvalue()
         notes = self.load_user_notes(item_name) # Load notes for the current item
-        self.info_text.insert(tk.END, notes)
+        self.info_text.insert("1.0", info_content + _NOTES_SECTION_MARKER + notes)
+        # Mark where the notes begin (the separator ends with a newline, so at the start of a line) so that
+        # save_user_notes reads just the notes. Left gravity keeps text typed at the very start inside the notes.
+        end_line = info_content.count("\n") + 1
+        notes_line = end_line + _NOTES_SECTION_MARKER_LINES # Counted without concatenating the separator again
+        self.info_text.mark_set(_NOTES_MARK, f"{notes_line}.0")
+        self.info_text.mark_gravity(_NOTES_MARK, tk.LEFT)
+        self.info_text.edit_modified(False) # Tk sets the flag again (firing <<Modified>>) once the user edits the text
+
+        # Highlight only the documentation part, which ends after info_content's last character
+        end_column = len(info_content) - (info_content.rfind("\n") + 1)
+        self._apply_syntax_highlighting(self.info_text, "1.0", f"{end_line}.{end_column}") # Apply highlighting
         
         self.info_text.see("1.0") # Scroll to the top of the info text area
         
@@ -1501,44 +2346,28 @@ class PythonHelperGUI:
 
         docstring = docstring.replace('\r\n', '\n') # Normalize line endings
 
-        # Define regex patterns to find example sections or code blocks
-        patterns = [
-            # Pattern 1: Looks for "Examples:", "Usage:", "How to Use:" followed by content
-            # and ends before another section header or end of string.
-            r"(?is)(?:^|\n\s*)(?:Examples?:|Usage(?:s)?:|How to Use:)\s*\n(.*?)(?=\n\s*(?:Parameters|Returns|Yields|Raises|Attributes|Notes|See Also|References|Warnings|Todo|Example|Usage):|\Z)",
-            # Pattern 2: Looks for lines starting with '>>>' (Python interactive session)
-            # and captures subsequent indented lines, ending before another section header or end of string.
-            r"(?is)(?:^|\n)(>>>.*?(?:\n[^\s>>>].*?)*)(?=\n\s*(?:Parameters|Returns|Yields|Raises|Attributes|Notes|See Also|References|Warnings|Todo|Example|Usage):|\Z)",
-        ]
-
         examples_found = []
-        for pattern in patterns:
-            for match in re.finditer(pattern, docstring):
-                example_text = match.group(1).strip()
-                if example_text:
-                    examples_found.append(example_text)
+        for match in _EXAMPLE_RE.finditer(docstring):
+            example_text = (match.group('section') or match.group('doctest') or "").strip()
+            if example_text:
+                examples_found.append(example_text)
         
         # Fallback: Find any indented code blocks (4 spaces or tab) that don't look like reStructuredText directives
         if not examples_found:
-            code_block_matches = re.findall(r"(?m)^(\s{4}.+|\t.+|>>>.*(?:\n\s{4}.*)*)", docstring)
-            for block in code_block_matches:
-                trimmed_block = block.strip()
-                # Filter out reStructuredText directives like ".. warning::" or list items like "- item"
-                if trimmed_block and not trimmed_block.startswith(('-', '*')) and not trimmed_block.startswith('..'):
-                    examples_found.append(trimmed_block)
-
-        # Remove duplicate examples and join them with double newlines
-        unique_examples = []
-        for ex in examples_found:
-            if ex not in unique_examples:
-                unique_examples.append(ex)
+            # Stream the matches rather than collecting them all first, since most are filtered out
+            trimmed_blocks = (match.group(1).strip() for match in _CODE_BLOCK_RE.finditer(docstring))
+            # Filter out reStructuredText directives like ".. warning::" or list items like "- item"
+            examples_found = [block for block in trimmed_blocks if block and not block.startswith(('-', '*', '..'))]
 
-        return "\n\n".join(unique_examples).strip()
+        # Remove duplicate examples (dict keys keep first-seen order) and join them with double newlines
+        return "\n\n".join(dict.fromkeys(examples_found)).strip()
 
     def load_user_notes(self, item_name: str):
         """Loads user-specific notes for a given item from a text file.
 
         Notes are stored in a dedicated directory with filenames derived from item names.
+        Each file is read once per session; later visits (e.g. via Back/Forward) are served
+        from memory, which save_user_notes keeps up to date.
 
         Args:
             item_name (str): The name of the item (e.g., 'abs', 'requests.get', 'numpy').
@@ -1546,54 +2375,61 @@ class PythonHelperGUI:
         Returns:
             str: The content of the notes file, or an empty string if no notes exist or an error occurs.
         """
-        safe_item_name = re.sub(r'[\\/:*?"<>|.]', '_', item_name) # Sanitize item name for filename
+        safe_item_name = _UNSAFE_FILENAME_CHARS_RE.sub('_', item_name) # Sanitize item name for filename
         notes_filename = f"notes_for_{safe_item_name}.txt"
         notes_file_path = os.path.join(NOTES_DIR, notes_filename)
-        
-        if os.path.exists(notes_file_path):
-            try:
-                with open(notes_file_path, 'r', encoding='utf-8') as f:
-                    return f.read() # Read and return notes content
-            except Exception as e:
-                print(f"Error loading notes for {item_name}: {e}")
-                self.status_bar.config(text=f"Error: Could not load your notes for '{item_name}'.")
-                return f"Error: Could not load your notes for {item_name}.\n"
-        return "" # Return empty string if file doesn't exist
+
+        notes = self._notes_cache.get(notes_file_path)
+        if notes is not None:
+            return notes
+        if self._notes_present is not None and notes_filename not in self._notes_present:
+            self._notes_cache[notes_file_path] = "" # Cached like a read, so save_user_notes sees "no notes", not "unknown"
+            return "" # No notes file, known without a filesystem call
+        try:
+            with open(notes_file_path, 'r', encoding='utf-8') as f:
+                notes = f.read() # Read the notes content
+        except FileNotFoundError:
+            notes = "" # Empty string if the file doesn't exist
+        except Exception as e:
+            print(f"Error loading notes for {item_name}: {e}")
+            self.status_bar.config(text=f"Error: Could not load your notes for '{item_name}'.")
+            return f"Error: Could not load your notes for {item_name}.\n" # Not cached, so the next visit retries
+        self._notes_cache[notes_file_path] = notes
+        return notes
 
     def save_user_notes(self, event=None):
         """Saves the user's notes from the info_text widget to a file.
 
-        Notes are extracted from the text widget based on a predefined marker.
-        This function is called automatically when the text widget loses focus or
+        Notes are read from the text widget starting at the mark display_info sets after the
+        notes separator. This function is called automatically when the text widget loses focus or
         manually via the 'Save Notes' button.
 
         Args:
             event (tk.Event, optional): The Tkinter event object (used for binding). Defaults to None.
         """
-        if self.current_selected_item: # Only save if an item is currently selected
-            safe_item_name = re.sub(r'[\\/:*?"<>|.]', '_', self.current_selected_item) # Sanitize for filename
+        # Only save if an item is currently selected and its notes are shown (search results and the
+        # welcome text replace them and remove the mark, so there is nothing to save then)
+        if self.current_selected_item and _NOTES_MARK in self.info_text.mark_names():
+            # Focus changes and every navigation call this; if nothing was typed since the notes were shown or
+            # last saved, skip reading the widget and writing the file altogether
+            if not self.info_text.edit_modified():
+                return
+            safe_item_name = _UNSAFE_FILENAME_CHARS_RE.sub('_', self.current_selected_item) # Sanitize for filename
             notes_file_path = os.path.join(NOTES_DIR, f"notes_for_{safe_item_name}.txt")
-            
-            full_text = self.info_text.get("1.0", tk.END) # Get all content from the text widget
-            
-            notes_section_marker = f"\n{'-'*15} Your Notes {'-'*15}\n"
-            # Find the start of the notes section marker
-            notes_section_start_index = full_text.find(notes_section_marker)
-
-            notes_text = ""
-            if notes_section_start_index != -1:
-                # Extract text after the marker (your notes)
-                notes_text = full_text[notes_section_start_index + len(notes_section_marker):].strip()
-            else:
-                # This indicates a problem if the marker is missing
-                print(f"ERROR: Notes separator not found for '{self.current_selected_item}'. This indicates a logic error in display_info or an unexpected modification of info_text. Notes might be overwritten.")
-                self.status_bar.config(text=f"Error: Notes separator missing for '{self.current_selected_item}'. Notes not saved cleanly.")
-            
-            try:
-                ensure_cache_dir() # Ensure notes directory exists
 
+            # Copy only the notes out of the widget, not the documentation above them
+            notes_text = self.info_text.get(_NOTES_MARK, tk.END).strip()
+            if notes_text == self._notes_cache.get(notes_file_path):
+                self.info_text.edit_modified(False) # Only the documentation part was edited, or edits were undone
+                return
+
+            try:
                 with open(notes_file_path, 'w', encoding='utf-8') as f:
                     f.write(notes_text) # Write the extracted notes to file
+                self._notes_cache[notes_file_path] = notes_text # Keep the in-memory copy in step with the file
+                if self._notes_present is not None:
+                    self._notes_present.add(os.path.basename(notes_file_path))
+                self.info_text.edit_modified(False) # Saved; clean until the next edit
                 self.status_bar.config(text=f"Notes saved for '{self.current_selected_item}'.")
             except Exception as e:
                 self.status_bar.config(text=f"Error saving notes for '{self.current_selected_item}': {e}")
@@ -1620,117 +2456,167 @@ class PythonHelperGUI:
 
     def search(self):
         """Performs a search across standard commands, installed modules, and PyPI packages."""
-        self.save_user_notes() # Save any active notes before search
         query = self.search_entry.get().lower().strip() # Get search query and normalize it
+        self._search_serial += 1 # Whatever this press shows, results of any search still running are outdated
+        shown = self._shown_search
+        if (shown is not None and shown[0] == query and shown[1] is self.installed_modules_cache
+                and shown[2] is self.pypi_index_cache and shown[3] is self._listbox_items):
+            # Same query over the same data, and its results are still listed: nothing to redo
+            self.status_bar.config(text=f"Results for '{query}' are already shown.")
+            return
+
+        self.save_user_notes() # Save any active notes before search
         
         self.info_text.delete(1.0, tk.END) # Clear info display
+        self.info_text.mark_unset(_NOTES_MARK) # No notes are shown any more
 
         if not query:
             # If search query is empty, provide instructions
             self.status_bar.config(text="Enter a search term in the box above and click 'Search'.")
-            self.menu_listbox.delete(0, tk.END)
+            self._set_listbox_items([])
             self.info_text.insert(tk.END, "Enter a search term in the box above to find Python commands, installed modules, or PyPI packages.\n")
             return
 
         self.status_bar.config(text=f"Searching for '{query}'...")
-        self.master.update_idletasks() # Force GUI update to show status
 
-        search_results_items = []
+        # Scan on a worker thread so the window keeps responding; the lists are passed as they are now
+        work = functools.partial(self._find_search_results, query, self.installed_modules_cache, self._search_index,
+                                 self.pypi_index_cache, self._pypi_text)
+        self._run_in_background(work, functools.partial(self._search_done, query, self._search_serial,
+                                                        self.current_category, self.installed_modules_cache,
+                                                        self.pypi_index_cache),
+                                self._search_executor)
 
-        # Search in Standard Commands
-        for cmd in self.standard_commands:
-            if query in cmd.lower():
-                search_results_items.append(f"STANDARD: {cmd}")
+    def _find_search_results(self, query: str, installed_modules: dict, index, packages: list, pypi_text: tuple):
+        """Worker-thread task: finds the standard, installed and PyPI items matching a search query.
 
-        # Search in Installed Modules and their members
-        for module_name, info in self.installed_modules_cache.items():
-            if query in module_name.lower():
-                search_results_items.append(f"INSTALLED: {module_name}")
-            for name_list in [info.get("functions", []), info.get("classes", []), info.get("modules", [])]:
-                for member_name in name_list:
-                    if query in member_name.lower() or query in f"{module_name}.{member_name}".lower():
-                        search_results_items.append(f"INSTALLED: {module_name}.{member_name}")
+        Args:
+            query (str): The lowercased search text.
+            installed_modules (dict): The installed modules cache to search.
+            index (tuple): The search index for those modules, or None to build it here.
+            packages (list of str): The PyPI package names.
+            pypi_text (tuple): The search text for those names, from build_pypi_text.
+
+        Returns:
+            tuple: The search index used, the sorted listbox items, the PyPI matches in index order,
+            and whether more than PYPI_SEARCH_LIMIT PyPI packages matched (only that many are kept).
+        """
+        # Search in Standard Commands and Installed Modules and their members, through the bigram index
+        if index is None: # Not built yet in the background; build it now
+            index = build_search_index(search_entries(self.standard_commands, installed_modules))
+        search_results_items = set(search_index(index, query)) # A set, so duplicates are dropped
 
         # Search in PyPI packages
-        for package in self.pypi_index_cache:
-            if query in package.lower():
-                search_results_items.append(f"NOT INSTALLED (PyPi): {package}")
+        # Stop once the listbox would hold more PyPI names than anyone scrolls through; one extra match
+        # tells whether the list was cut short
+        pypi_matches = match_pypi_packages(packages, pypi_text, query, PYPI_SEARCH_LIMIT + 1)
+        truncated = len(pypi_matches) > PYPI_SEARCH_LIMIT
+        del pypi_matches[PYPI_SEARCH_LIMIT:]
+        search_results_items.update(f"NOT INSTALLED (PyPi): {package}" for package in pypi_matches)
+        return index, sorted(search_results_items), pypi_matches, truncated # Sort the unique results for display
+
+    def _search_done(self, query: str, serial: int, category: str, installed_modules: dict, packages: list,
+                     future: concurrent.futures.Future):
+        """Tk-thread callback: shows the results found by _find_search_results.
+
+        Args:
+            query (str): The search text the results were computed for.
+            serial (int): The value of _search_serial when the search started.
+            category (str): The category shown when the search started.
+            installed_modules (dict): The installed modules cache that was searched.
+            packages (list of str): The PyPI index that was searched.
+            future (concurrent.futures.Future): The finished background task.
+        """
+        try:
+            index, search_results_items, pypi_matches, truncated = future.result()
+        except Exception as e:
+            if serial == self._search_serial: # Only the latest search reports; it replaces the "Searching..." status
+                self.status_bar.config(text=f"An unexpected error occurred during search for '{query}': {e}")
+            return
+        if self._search_index is None and installed_modules is self.installed_modules_cache:
+            self._search_index = index # Keep an index built for this search
+        if serial != self._search_serial or category != self.current_category:
+            return # Outdated: a newer search started, or the user switched categories meanwhile
+
+        # Warm the detail cache for the first few PyPI hits so selecting one is instant
+        self.prefetch_pypi_details(pypi_matches[:PYPI_PREFETCH_LIMIT])
+
+        # An item may have been opened from the old list while the search ran
+        self.save_user_notes()
+        self.info_text.delete(1.0, tk.END)
+        self.info_text.mark_unset(_NOTES_MARK)
 
-        self.menu_listbox.delete(0, tk.END) # Clear listbox for results
         if search_results_items:
             # Display results in the listbox
-            for item in sorted(list(set(search_results_items))): # Use set to remove duplicates before sorting
-                self.menu_listbox.insert(tk.END, item)
+            self._set_listbox_items(search_results_items)
             self.current_category = "SEARCH" # Set category to SEARCH
-            self.status_bar.config(text=f"Search complete. {len(search_results_items)} results found for '{query}'. Select an item to view.")
+            status = f"Search complete. {len(search_results_items)} results found for '{query}'. Select an item to view."
+            if truncated:
+                status += f" Only the first {PYPI_SEARCH_LIMIT} PyPI matches are listed; refine the search to see others."
+            self.status_bar.config(text=status)
             self.info_text.insert(tk.END, "Search results displayed in the left menu.\n\nSelect an item to view its documentation and your notes.\n")
         else:
             # No results found
-            self.menu_listbox.insert(tk.END, "No results found for your search.")
+            search_results_items = ["No results found for your search."]
+            self._set_listbox_items(search_results_items)
             self.current_category = "EMPTY_SEARCH" # Indicate no results
             self.status_bar.config(text=f"No results found for '{query}'.")
             self.info_text.insert(tk.END, "No items match your search query.\n\nPlease try a different search term or browse categories.\n")
         
         self.info_text.see("1.0") # Scroll to top of info text
+        self._shown_search = (query, installed_modules, packages, search_results_items)
+
+    def _rebuild_search_index(self):
+        """Drops the search index and builds a new one for the current names on a background thread."""
+        self._search_index = None
+        installed_modules = self.installed_modules_cache
+        work = functools.partial(build_search_index, search_entries(self.standard_commands, installed_modules))
+        self._run_in_background(work, functools.partial(self._search_index_built, installed_modules))
+
+    def _search_index_built(self, installed_modules: dict, future: concurrent.futures.Future):
+        """Tk-thread callback: installs the index from _rebuild_search_index unless it is outdated.
+
+        Args:
+            installed_modules (dict): The installed modules cache the index was built from.
+            future (concurrent.futures.Future): The finished background task.
+        """
+        # Skip it if the installed modules changed meanwhile, or a search already built one
+        if installed_modules is not self.installed_modules_cache or self._search_index is not None:
+            return
+        try:
+            self._search_index = future.result()
+        except Exception as e:
+            # Left as None, so the next search builds the index itself
+            self.status_bar.config(text=f"An unexpected error occurred while indexing names for search: {e}")
 
     def clear_search(self):
         """Clears the search bar and resets the listbox to the previously active category."""
         self.save_user_notes() # Save any active notes
+        self._search_serial += 1 # Drop the results of a search still running
         
         self.search_entry.delete(0, tk.END) # Clear the search input field
         self.info_text.delete(1.0, tk.END) # Clear the info display area
+        self.info_text.mark_unset(_NOTES_MARK) # No notes are shown any more
         self.info_text.insert(tk.END, "Welcome to PyRef! Select a category or search for documentation.\n")
         
         # Restore the listbox content based on the current category
-        if self.current_category == "INSTALLED":
-            self.show_installed()
-        elif self.current_category == "PYPI":
-            self.show_pypi()
-        else:
-            self.show_standard() # Default to standard if category was SEARCH or EMPTY_SEARCH
+        self._category_views.get(self.current_category, self.show_standard)() # Standard after SEARCH or EMPTY_SEARCH
         self.status_bar.config(text="Search cleared. Displaying default category.")
         self.info_text.see("1.0")
 
     def show_about_dialog(self):
         """Displays an 'About PyRef' dialog with information about the application."""
-        about_text = f"""
-        **PyRef: Your Offline Python Reference & Personal Notebook**
-
-        **What is PyRef?**
-        PyRef is a lightweight, local desktop application designed to be your quick, offline reference for Python. It provides instant access to documentation for:
-        
-        1.  **Standard Python Commands:** Built-in functions, types, and constants (e.g., `print()`, `list`, `True`).
-        2.  **Installed Python Modules:** Documentation for packages you've installed via `pip` (e.g., `requests`, `numpy`, `pygame`) and their individual functions, classes, and submodules.
-        3.  **PyPI Packages (Not Installed):** Information on packages available on the Python Package Index (PyPI), allowing you to discover new tools and see installation commands without leaving the app.
-
-        **Key Features:**
-        * **Offline Access:** Once cached, documentation for standard and installed modules is available without an internet connection. PyPI package details are cached for future offline viewing too.
-        * **Personal Notes:** Add and save your own notes, reminders, and code snippets directly alongside the documentation for any item. Your notes are saved locally and persist between sessions.
-        * **Integrated Search:** Quickly find documentation across all categories (Standard, Installed, PyPI).
-        * **Syntax Highlighting:** Docstrings and code examples are enhanced with basic Python syntax highlighting for better readability.
-        * **Clickable URLs:** External links (like PyPI project pages or homepages) are clickable, opening directly in your web browser.
-        * **History Navigation:** Use the "Back" and "Forward" buttons to easily revisit previously viewed items.
-        * **Configurable Font Size:** Adjust the text size to your preference for comfortable reading.
-        * **Dynamic UI:** Resizable panels allow you to customize the layout.
-        
-        **Why PyRef?**
-        PyRef aims to provide a fast, focused, and personal documentation experience, reducing the need to constantly switch to web browsers or external documentation sites when you just need a quick lookup or want to jot down a thought related to a specific function.
-
-        **Caching & Data:**
-        PyRef intelligently caches data to minimize network requests and maximize offline utility.
-        * Standard commands are cached for 30 days.
-        * Installed modules are re-indexed weekly to reflect changes from `pip install`/`uninstall`.
-        * PyPI index is refreshed daily. Individual PyPI package details are cached for 7 days.
-        All cache files and your personal notes are stored in:
-        `{CACHE_DIR}` (your home directory's hidden PyRef cache folder).
-
-        **Author:** Andrew Stephens (goldalchemist)
-        **Version:** 1.0
-        **License:** MIT License
-
-        Thank you for using PyRef!
-        """
-        messagebox.showinfo("About PyRef", about_text)
+        messagebox.showinfo("About PyRef", self._ABOUT_TEXT) # Built once, when the class is defined
+
+    def _on_close(self):
+        """Stops background work, shuts down PyPI fetches and the HTTP session, then destroys the window."""
+        self._closing.set() # Running workers stop at their next check, so the process can exit promptly
+        self._pypi_fetch_executor.shutdown(wait=False, cancel_futures=True) # Drop queued prefetches; running ones finish on their own
+        self._background_executor.shutdown(wait=False, cancel_futures=True)
+        self._search_executor.shutdown(wait=False, cancel_futures=True)
+        if self._http_session is not None:
+            self._http_session.close() # Close pooled keep-alive connections
+        self.master.destroy()
 
 
 # --- Main Application Entry Point ---